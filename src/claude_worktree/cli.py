@@ -251,6 +251,21 @@ def complete_term_options() -> list[str]:
     ]
 
 
+def _rc_file_mentions_cw(relative_path: str) -> bool:
+    """Check whether a shell rc file under the home directory mentions cw.
+
+    Opens the file directly instead of stat-ing it first; a missing or
+    unreadable file simply counts as no.
+    """
+    import os
+
+    try:
+        with open(os.path.join(os.path.expanduser("~"), relative_path)) as f:
+            return "cw" in f.read()
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
 def is_completion_installed() -> bool:
     """Check if shell completion appears to be installed."""
     import os
@@ -261,16 +276,13 @@ def is_completion_installed() -> bool:
 
     # Check for common shell completion indicators
     if "bash" in shell_env:
-        bashrc = Path.home() / ".bashrc"
-        if bashrc.exists() and "cw" in bashrc.read_text():
+        if _rc_file_mentions_cw(".bashrc"):
             return True
     elif "zsh" in shell_env:
-        zshrc = Path.home() / ".zshrc"
-        if zshrc.exists() and "cw" in zshrc.read_text():
+        if _rc_file_mentions_cw(".zshrc"):
             return True
     elif "fish" in shell_env:
-        config_fish = Path.home() / ".config" / "fish" / "config.fish"
-        if config_fish.exists() and "cw" in config_fish.read_text():
+        if _rc_file_mentions_cw(".config/fish/config.fish"):
             return True
     elif sys.platform == "win32" or os.environ.get("PSModulePath"):
         # PowerShell - harder to detect, assume not installed
@@ -289,47 +301,38 @@ def prompt_completion_setup() -> None:
         return
 
     config = load_config()
+    state = config.setdefault("shell_completion", {})
 
     # Check if we've already prompted
-    if config["shell_completion"]["prompted"]:
+    if state.get("prompted"):
         return
 
+    response = False
     # Check if completion is already installed
-    if is_completion_installed():
-        # Mark as prompted and installed
-        config["shell_completion"]["prompted"] = True
-        config["shell_completion"]["installed"] = True
-        save_config(config)
-        return
+    installed = is_completion_installed()
+    if not installed:
+        # Prompt user
+        console.print("\n[bold cyan]💡 Shell Completion Setup[/bold cyan]")
+        console.print("\nWould you like to enable tab completion for cw commands?")
+        console.print("This makes it easier to autocomplete branch names and options.\n")
 
-    # Prompt user
-    console.print("\n[bold cyan]💡 Shell Completion Setup[/bold cyan]")
-    console.print("\nWould you like to enable tab completion for cw commands?")
-    console.print("This makes it easier to autocomplete branch names and options.\n")
-
-    try:
-        response = typer.confirm("Enable shell completion?", default=True)
-    except (KeyboardInterrupt, EOFError):
-        # User cancelled (Ctrl+C or EOF)
-        config["shell_completion"]["prompted"] = True
-        config["shell_completion"]["installed"] = False
-        save_config(config)
-        console.print("\n[dim]You can always set this up later with: cw shell-setup[/dim]\n")
-        return
+        try:
+            response = typer.confirm("Enable shell completion?", default=True)
+        except (KeyboardInterrupt, EOFError):
+            # User cancelled (Ctrl+C or EOF) - treated like declining
+            pass
+        installed = response
 
-    # Mark as prompted
-    config["shell_completion"]["prompted"] = True
+    # Record the outcome with a single config write
+    state["prompted"] = True
+    state["installed"] = installed
+    save_config(config)
 
     if response:
         # User wants to install - run shell-setup
-        config["shell_completion"]["installed"] = True
-        save_config(config)
         console.print("")
         shell_setup()
-    else:
-        # User declined
-        config["shell_completion"]["installed"] = False
-        save_config(config)
+    elif not installed:
         console.print("\n[dim]You can always set this up later with: cw shell-setup[/dim]\n")
 
 
@@ -357,10 +360,12 @@ def main(
     ctx.ensure_object(dict)
     ctx.obj["global_mode"] = global_mode
 
-    # Set ContextVar so resolve_worktree_target() and delete_worktree() can detect global mode
+    # Set global mode so resolve_worktree_target() and delete_worktree() can detect global mode
+    from .git_utils import clear_worktree_cache
     from .operations.helpers import set_global_mode
 
     set_global_mode(global_mode)
+    clear_worktree_cache()
 
     # Skip callbacks for internal commands that output machine-readable content
     if len(sys.argv) > 1 and sys.argv[1] in ["_shell-function", "_path"]:
@@ -1324,9 +1329,10 @@ def _interactive_path_selection(global_mode: bool) -> None:
                 worktrees = parse_worktrees(repo_path)
             except Exception:
                 continue
+            repo_resolved = repo_path.resolve()
             for branch, path in worktrees:
                 normalized = normalize_branch_name(branch)
-                if path.resolve() == repo_path.resolve():
+                if path == repo_path or path.resolve() == repo_resolved:
                     # Root worktree — add as first entry per repo
                     label = f"{name} (root)"
                     entries.insert(0, (label, str(path)))
@@ -1339,9 +1345,10 @@ def _interactive_path_selection(global_mode: bool) -> None:
             print(f"Error: {e}", file=sys.stderr)
             raise typer.Exit(code=1)
         worktrees = parse_worktrees(repo)
+        repo_resolved = repo.resolve()
         for branch, path in worktrees:
             normalized = normalize_branch_name(branch)
-            if path.resolve() == repo.resolve():
+            if path == repo or path.resolve() == repo_resolved:
                 # Root worktree — add as first entry
                 root_label = normalized or "main"
                 entries.insert(0, (f"{root_label} (root)", str(path)))
@@ -1653,18 +1660,9 @@ def shell_function(
             shell_file = "cw.ps1"
 
         # Use importlib.resources to read the file from the package
-        script_content = None
-        try:
-            # Python 3.9+
-            from importlib.resources import files
-
-            shell_functions = files("claude_worktree").joinpath("shell_functions")
-            script_content = (shell_functions / shell_file).read_text()
-        except (ImportError, AttributeError):
-            # Python 3.8 fallback
-            import importlib.resources as pkg_resources
+        from importlib.resources import files
 
-            script_content = pkg_resources.read_text("claude_worktree.shell_functions", shell_file)
+        script_content = files("claude_worktree.shell_functions").joinpath(shell_file).read_text()
 
         if not script_content or not script_content.strip():
             print(f"Error: Shell function file is empty for {shell}", file=sys.stderr)
@@ -7,8 +7,6 @@ import typer
 from .console import get_console
 from .git_utils import get_config, get_repo_root, is_non_interactive, set_config
 
-console = get_console()
-
 # Common files that users might want to share across worktrees
 COMMON_SHARED_FILES = [
     ".env",
@@ -140,6 +138,7 @@ def prompt_cwshare_setup() -> None:
     detected_files = detect_common_files(repo)
 
     # Prompt user
+    console = get_console()
     console.print("\n[bold cyan]💡 .cwshare File Setup[/bold cyan]")
     console.print("\nWould you like to create a [cyan].cwshare[/cyan] file?")
     console.print("This lets you automatically copy files to new worktrees (like .env, configs).\n")
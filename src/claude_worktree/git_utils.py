@@ -1,15 +1,27 @@
 """Git operations wrapper utilities."""
 
+import atexit
 import os
 import platform
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from .exceptions import GitError, InvalidBranchError
 
+# Interned so comparisons against parsed (also interned) branches hit the
+# identity fast path
+_REFS_HEADS_PREFIX = sys.intern("refs/heads/")
+_DETACHED = sys.intern("(detached)")
+
 
 def run_command(
     cmd: list[str],
@@ -37,6 +49,10 @@ def run_command(
         kwargs["stdout"] = subprocess.PIPE
         kwargs["stderr"] = subprocess.STDOUT
         kwargs["text"] = True
+    if sys.platform != "win32":
+        # Python-created fds are non-inheritable (PEP 446), so skip the
+        # close-every-fd loop the child would otherwise run before exec
+        kwargs["close_fds"] = False
 
     try:
         result = subprocess.run(cmd, cwd=cwd, check=False, **kwargs)
@@ -53,6 +69,8 @@ def git_command(
     repo: Path | None = None,
     check: bool = True,
     capture: bool = False,
+    read_only: bool = False,
+    gitdir: Path | None = None,
 ) -> subprocess.CompletedProcess[str]:
     """
     Run a git command.
@@ -62,6 +80,11 @@ def git_command(
         repo: Repository path
         check: Raise exception on non-zero exit code
         capture: Capture stdout/stderr
+        read_only: Pass --no-optional-locks so pure reads (status, diff,
+            rev-list, ...) never take index.lock or refresh the index
+        gitdir: Git directory of repo (see get_git_dir); when given, git is
+            pointed at it with --git-dir/--work-tree instead of rediscovering
+            the repository layout from repo
 
     Returns:
         CompletedProcess instance
@@ -69,10 +92,102 @@ def git_command(
     Raises:
         GitError: If git command fails
     """
-    cmd = ["git"] + list(args)
+    cmd = ["git"]
+    if read_only:
+        cmd.append("--no-optional-locks")
+    if gitdir is not None and repo is not None:
+        cmd += ["--git-dir", str(gitdir), "--work-tree", str(repo)]
+    cmd += args
     return run_command(cmd, cwd=repo, check=check, capture=capture)
 
 
+_git_dir_cache: dict[Path, Path] = {}
+
+
+def get_git_dir(path: Path) -> Path:
+    """
+    Get the git directory of a worktree, caching the result per path.
+
+    Linked worktrees have a ``.git`` file pointing at their admin directory
+    (``gitdir: <main>/.git/worktrees/<name>``), which is read directly; the
+    main worktree's ``.git`` directory is used as-is. Anything else falls
+    back to ``git rev-parse --absolute-git-dir``.
+
+    Args:
+        path: Worktree path
+
+    Returns:
+        Absolute path to the worktree's git directory
+
+    Raises:
+        GitError: If path is not inside a git repository
+    """
+    cached = _git_dir_cache.get(path)
+    if cached is not None and cached.is_dir():
+        return cached
+
+    dot_git = path / ".git"
+    gitdir: Path | None = None
+    if dot_git.is_dir():
+        gitdir = dot_git
+    elif dot_git.is_file():
+        try:
+            content = dot_git.read_text(encoding="utf-8").strip()
+        except OSError:
+            content = ""
+        if content.startswith("gitdir:"):
+            candidate = Path(content[len("gitdir:") :].strip())
+            if not candidate.is_absolute():
+                candidate = path / candidate
+            if candidate.is_dir():
+                gitdir = candidate
+
+    if gitdir is None:
+        result = git_command("rev-parse", "--absolute-git-dir", repo=path, capture=True)
+        gitdir = Path(result.stdout.strip())
+
+    _git_dir_cache[path] = gitdir
+    return gitdir
+
+
+def git_stream_lines(*args: str, repo: Path | None = None) -> Iterator[str]:
+    """
+    Run a git command and yield its stdout line by line as it is produced.
+
+    Unlike git_command(capture=True), output is never buffered in full, so
+    large outputs (e.g. diffs) can be printed with constant memory.
+
+    Args:
+        *args: Git command arguments
+        repo: Repository path
+
+    Yields:
+        Output lines, including their trailing newline
+
+    Raises:
+        GitError: If git cannot be started or exits with non-zero status
+    """
+    cmd = ["git"] + list(args)
+    # stderr goes to a file, not a pipe: a pipe nobody drains until stdout
+    # hits EOF would block git once it fills, and stdout would never end
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            proc = subprocess.Popen(
+                cmd, cwd=repo, stdout=subprocess.PIPE, stderr=stderr_file, text=True
+            )
+        except FileNotFoundError as e:
+            raise GitError(f"Command not found: {cmd[0]}") from e
+
+        assert proc.stdout is not None
+        with proc:
+            yield from proc.stdout
+
+        if proc.returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors="replace")
+            raise GitError(f"Command failed: {' '.join(cmd)}\n{stderr}")
+
+
 def get_repo_root(path: Path | None = None) -> Path:
     """
     Get the root directory of the git repository.
@@ -106,6 +221,19 @@ def get_current_branch(repo: Path | None = None) -> str:
     Raises:
         InvalidBranchError: If in detached HEAD state
     """
+    # Fast path: read HEAD straight from the git directory instead of forking git
+    try:
+        head = (get_git_dir(repo or Path.cwd()) / "HEAD").read_text(encoding="utf-8").strip()
+    except (GitError, OSError):
+        head = ""
+    if head.startswith(f"ref: {_REFS_HEADS_PREFIX}"):
+        branch = head.removeprefix(f"ref: {_REFS_HEADS_PREFIX}")
+        # The reftable backend leaves a placeholder HEAD pointing at ".invalid"
+        if branch != ".invalid":
+            return branch
+    elif re.fullmatch(r"[0-9a-f]{40}|[0-9a-f]{64}", head):
+        raise InvalidBranchError("In detached HEAD state")
+
     result = git_command("rev-parse", "--abbrev-ref", "HEAD", repo=repo, capture=True)
     branch = result.stdout.strip()
     if branch == "HEAD":
@@ -113,6 +241,108 @@ def get_current_branch(repo: Path | None = None) -> str:
     return branch
 
 
+class PersistentGit:
+    """
+    Long-running ``git cat-file --batch-check`` process for one repository.
+
+    Resolving a ref through the open pipe avoids a fork+exec of git per
+    lookup. Refs are re-read by git on every request, so branches created
+    or deleted while the process is alive are seen immediately.
+    """
+
+    def __init__(self, repo: Path) -> None:
+        self.repo = repo
+        self._lock = threading.Lock()
+        self._proc = subprocess.Popen(
+            ["git", "-C", str(repo), "cat-file", "--batch-check=%(objectname) %(objecttype)"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+
+    def resolve(self, ref: str) -> str | None:
+        """
+        Resolve a revision to an object name.
+
+        Args:
+            ref: Revision (branch, tag, commit-ish, ...)
+
+        Returns:
+            Object name, or None if the revision does not exist
+
+        Raises:
+            GitError: If the git process has exited
+        """
+        # One request per line; a name can't span lines or be empty
+        if not ref or "\n" in ref:
+            return None
+
+        stdin, stdout = self._proc.stdin, self._proc.stdout
+        assert stdin is not None and stdout is not None
+        with self._lock:
+            try:
+                stdin.write(f"{ref}\n")
+                stdin.flush()
+                line = stdout.readline()
+            except OSError as e:
+                raise GitError(f"git cat-file for {self.repo} is not running") from e
+        if not line:
+            raise GitError(f"git cat-file for {self.repo} exited unexpectedly")
+
+        object_name, _, object_type = line.rstrip("\n").rpartition(" ")
+        if object_type in ("missing", "ambiguous"):
+            return None
+        return object_name
+
+    def close(self) -> None:
+        """Terminate the git process."""
+        if self._proc.stdin:
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass
+        try:
+            self._proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        if self._proc.stdout:
+            self._proc.stdout.close()
+
+
+_persistent_git: dict[Path, PersistentGit] = {}
+_persistent_git_lock = threading.Lock()
+
+
+def get_persistent_git(repo: Path | None = None) -> PersistentGit:
+    """
+    Get the shared PersistentGit for a repository, starting it if needed.
+
+    Args:
+        repo: Repository path (defaults to current directory)
+
+    Returns:
+        PersistentGit instance for the resolved repository path
+    """
+    key = (repo or Path.cwd()).resolve()
+    with _persistent_git_lock:
+        persistent = _persistent_git.get(key)
+        if persistent is None:
+            persistent = _persistent_git[key] = PersistentGit(key)
+    return persistent
+
+
+@atexit.register
+def close_persistent_git() -> None:
+    """Terminate all PersistentGit processes started by this process."""
+    with _persistent_git_lock:
+        instances = list(_persistent_git.values())
+        _persistent_git.clear()
+    for persistent in instances:
+        persistent.close()
+
+
 def branch_exists(branch: str, repo: Path | None = None) -> bool:
     """
     Check if a branch exists.
@@ -124,10 +354,49 @@ def branch_exists(branch: str, repo: Path | None = None) -> bool:
     Returns:
         True if branch exists, False otherwise
     """
+    try:
+        return get_persistent_git(repo).resolve(branch) is not None
+    except (GitError, OSError):
+        # Drop a dead process so the next call starts a fresh one
+        with _persistent_git_lock:
+            dead = _persistent_git.pop((repo or Path.cwd()).resolve(), None)
+        if dead is not None:
+            dead.close()
+
     result = git_command("rev-parse", "--verify", branch, repo=repo, check=False, capture=True)
     return result.returncode == 0
 
 
+def first_existing_branch(candidates: Iterable[str], repo: Path | None = None) -> str | None:
+    """
+    Find the first local branch that exists from an ordered list of names.
+
+    All candidates are checked with a single `git for-each-ref` call.
+
+    Args:
+        candidates: Branch names in order of preference
+        repo: Repository path
+
+    Returns:
+        First existing branch name, or None if none exist
+    """
+    candidates = list(candidates)
+    if not candidates:
+        return None
+    result = git_command(
+        "for-each-ref",
+        "--format=%(refname)",
+        *(_REFS_HEADS_PREFIX + name for name in candidates),
+        repo=repo,
+        capture=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return None
+    present = {ref.removeprefix(_REFS_HEADS_PREFIX) for ref in result.stdout.splitlines()}
+    return next((name for name in candidates if name in present), None)
+
+
 def remote_branch_exists(
     branch: str, repo: Path | None = None, remote: str = "origin"
 ) -> bool:
@@ -149,10 +418,76 @@ def remote_branch_exists(
     return result.returncode == 0
 
 
+# Per-repo snapshot of `git config --local --list`, keyed by resolved repo
+# path and stamped with the config file's (mtime_ns, size) so edits made by
+# other processes are picked up.
+_config_cache: dict[Path, tuple[tuple[int, int] | None, dict[str, str]]] = {}
+
+
+def _canonical_config_key(key: str) -> str:
+    """Lowercase the section and variable name of a config key, as git does."""
+    section, _, rest = key.partition(".")
+    subsection, dot, name = rest.rpartition(".")
+    if not dot:
+        return f"{section.lower()}.{rest.lower()}"
+    return f"{section.lower()}.{subsection}.{name.lower()}"
+
+
+def _get_common_dir(repo: Path) -> Path:
+    """Return the git directory shared by all worktrees of repo."""
+    gitdir = get_git_dir(repo)
+    commondir = gitdir / "commondir"
+    if commondir.is_file():
+        return gitdir / commondir.read_text(encoding="utf-8").strip()
+    return gitdir
+
+
+def _config_stamp(repo: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) of the repository's local config file, if found."""
+    try:
+        st = (_get_common_dir(repo) / "config").stat()
+    except (GitError, OSError):
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_config(repo: Path) -> dict[str, str] | None:
+    """Return all local config entries for repo, reading git only when stale."""
+    stamp = _config_stamp(repo)
+    cached = _config_cache.get(repo)
+    if cached is not None and stamp is not None and cached[0] == stamp:
+        return cached[1]
+
+    result = git_command("config", "--local", "--list", "-z", repo=repo, check=False, capture=True)
+    if result.returncode != 0:
+        return None
+
+    entries: dict[str, str] = {}
+    for record in result.stdout.split("\0"):
+        if record:
+            key, _, value = record.partition("\n")
+            entries[key] = value  # later entries win, like `git config --get`
+    _config_cache[repo] = (stamp, entries)
+    return entries
+
+
+def invalidate_config_cache(repo: Path | None = None) -> None:
+    """
+    Drop the cached local config for a repository.
+
+    Args:
+        repo: Repository path (defaults to current directory)
+    """
+    _config_cache.pop((repo or Path.cwd()).resolve(), None)
+
+
 def get_config(key: str, repo: Path | None = None) -> str | None:
     """
     Get a git config value.
 
+    All local config entries are read with a single git call and cached per
+    repository, so repeated lookups don't fork git.
+
     Args:
         key: Config key
         repo: Repository path
@@ -160,10 +495,10 @@ def get_config(key: str, repo: Path | None = None) -> str | None:
     Returns:
         Config value or None if not found
     """
-    result = git_command("config", "--local", "--get", key, repo=repo, check=False, capture=True)
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return None
+    entries = _load_config((repo or Path.cwd()).resolve())
+    if entries is None:
+        return None
+    return entries.get(_canonical_config_key(key))
 
 
 def set_config(key: str, value: str, repo: Path | None = None) -> None:
@@ -175,18 +510,26 @@ def set_config(key: str, value: str, repo: Path | None = None) -> None:
         value: Config value
         repo: Repository path
     """
-    git_command("config", "--local", key, value, repo=repo)
+    try:
+        git_command("config", "--local", key, value, repo=repo)
+    finally:
+        invalidate_config_cache(repo)
 
 
 def unset_config(key: str, repo: Path | None = None) -> None:
     """
     Unset a git config value.
 
+    Does nothing (and runs no git command) if the key is not set.
+
     Args:
         key: Config key
         repo: Repository path
     """
+    if get_config(key, repo) is None:
+        return
     git_command("config", "--local", "--unset-all", key, repo=repo, check=False)
+    invalidate_config_cache(repo)
 
 
 def normalize_branch_name(branch: str) -> str:
@@ -205,9 +548,7 @@ def normalize_branch_name(branch: str) -> str:
         >>> normalize_branch_name("feature-branch")
         "feature-branch"
     """
-    if branch.startswith("refs/heads/"):
-        return branch[11:]
-    return branch
+    return branch.removeprefix(_REFS_HEADS_PREFIX)
 
 
 def get_feature_worktrees(repo: Path | None = None) -> list[tuple[str, Path]]:
@@ -222,20 +563,23 @@ def get_feature_worktrees(repo: Path | None = None) -> list[tuple[str, Path]]:
     Returns:
         List of (branch_name, path) tuples with normalized branch names.
     """
-    effective_repo = get_repo_root(repo)
+    # A path holding .git is already a worktree top level; skip rev-parse
+    if repo is not None and os.path.lexists(os.path.join(repo, ".git")):
+        effective_repo = repo
+    else:
+        effective_repo = get_repo_root(repo)
     worktrees = parse_worktrees(effective_repo)
     if not worktrees:
         return []
 
-    main_path = worktrees[0][1].resolve()
+    main_path = os.path.realpath(worktrees[0][1])
     result = []
     for branch, path in worktrees:
-        if path.resolve() == main_path:
+        if os.path.realpath(path) == main_path:
             continue
-        if branch == "(detached)":
+        if branch == _DETACHED:
             continue
-        branch_name = normalize_branch_name(branch)
-        result.append((branch_name, path))
+        result.append((branch.removeprefix(_REFS_HEADS_PREFIX), path))
     return result
 
 
@@ -261,36 +605,216 @@ def get_main_repo_root(repo: Path | None = None) -> Path:
     return current_root
 
 
+def _worktrees_stamp(repo: Path) -> tuple[tuple[str, int, int], ...] | None:
+    """
+    Fingerprint the files `git worktree list` reads.
+
+    Covers the main HEAD, the worktrees admin directory, and each linked
+    worktree's HEAD and gitdir files. These are replaced by rename, so
+    (mtime_ns, inode) changes on add, remove, move and checkout.
+
+    Returns:
+        Hashable stamp, or None if the git directory cannot be inspected
+    """
+    try:
+        common = _get_common_dir(repo)
+        paths = [common / "HEAD", common / "worktrees"]
+        try:
+            with os.scandir(common / "worktrees") as entries:
+                for entry in entries:
+                    paths += [Path(entry.path, "HEAD"), Path(entry.path, "gitdir")]
+        except FileNotFoundError:
+            pass
+
+        stamp = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            stamp.append((str(path), st.st_mtime_ns, st.st_ino))
+    except (GitError, OSError):
+        return None
+    return tuple(sorted(stamp))
+
+
+_PORCELAIN_WORKTREE_RE = re.compile(r"^worktree (.+)$", re.MULTILINE)
+_PORCELAIN_BRANCH_RE = re.compile(r"^branch (.+)$", re.MULTILINE)
+
+
+@lru_cache(maxsize=64)
+def _parse_worktrees_cached(
+    repo: str, stamp: tuple[tuple[str, int, int], ...]
+) -> tuple[tuple[str, Path], ...]:
+    """Memoized parse_worktrees body; stamp only keys the cache."""
+    return tuple(_parse_worktrees(Path(repo)))
+
+
 def parse_worktrees(repo: Path) -> list[tuple[str, Path]]:
     """
     Parse git worktree list output.
 
+    Results are memoized per repository until a worktree is added, removed,
+    moved or switches branch, so repeated lookups in one command don't
+    re-run git.
+
     Args:
         repo: Repository path
 
     Returns:
         List of (branch_or_detached, path) tuples where path is a Path object
     """
+    return list(_iter_worktrees(repo))
+
+
+@lru_cache(maxsize=64)
+def _parse_worktree_branches_cached(
+    repo: str, stamp: tuple[tuple[str, int, int], ...]
+) -> tuple[tuple[str | None, Path], ...]:
+    """Memoized parse_worktree_branches body; stamp only keys the cache."""
+    return tuple(_iter_short_branches(_parse_worktrees_cached(repo, stamp)))
+
+
+def parse_worktree_branches(repo: Path) -> list[tuple[str | None, Path]]:
+    """
+    Parse git worktree list output with branch names already normalized.
+
+    Like parse_worktrees, but each branch has its refs/heads/ prefix removed
+    and detached worktrees carry None, so callers don't re-normalize.
+
+    Args:
+        repo: Repository path
+
+    Returns:
+        List of (branch_or_none, path) tuples
+    """
+    stamp = _worktrees_stamp(repo)
+    if stamp is None:
+        return list(_iter_short_branches(_iter_worktrees(repo)))
+    return list(_parse_worktree_branches_cached(str(repo), stamp))
+
+
+def _iter_short_branches(
+    worktrees: Iterable[tuple[str, Path]],
+) -> Iterator[tuple[str | None, Path]]:
+    """Map parse_worktrees entries to (short branch or None if detached, path)."""
+    for branch, path in worktrees:
+        if branch == _DETACHED:
+            yield None, path
+        else:
+            yield branch.removeprefix(_REFS_HEADS_PREFIX), path
+
+
+def _iter_worktrees(repo: Path) -> Iterator[tuple[str, Path]]:
+    """Yield (branch_or_detached, path) pairs, parsing lazily when uncached."""
+    stamp = _worktrees_stamp(repo)
+    if stamp is None:
+        result = git_command("worktree", "list", "--porcelain", repo=repo, capture=True)
+        yield from _iter_porcelain(result.stdout)
+    else:
+        yield from _parse_worktrees_cached(str(repo), stamp)
+
+
+def _parse_worktrees(repo: Path) -> list[tuple[str, Path]]:
+    """Run `git worktree list --porcelain` and parse it (uncached)."""
     result = git_command("worktree", "list", "--porcelain", repo=repo, capture=True)
-    lines = result.stdout.strip().splitlines()
+    return list(_iter_porcelain(result.stdout))
+
+
+def _iter_porcelain(output: str) -> Iterator[tuple[str, Path]]:
+    """Yield (branch_or_detached, path) pairs from porcelain worktree output."""
+    # Records are separated by a blank line; each starts with "worktree <path>"
+    for block in output.replace("\r\n", "\n").split("\n\n"):
+        worktree_match = _PORCELAIN_WORKTREE_RE.search(block)
+        if worktree_match:
+            branch_match = _PORCELAIN_BRANCH_RE.search(block)
+            branch = sys.intern(branch_match.group(1)) if branch_match else _DETACHED
+            yield branch, Path(worktree_match.group(1))
 
-    items: list[tuple[str, Path]] = []
-    cur_path: str | None = None
-    cur_branch: str | None = None
 
-    for line in lines:
-        if line.startswith("worktree "):
-            cur_path = line.split(" ", 1)[1]
-        elif line.startswith("branch "):
-            cur_branch = line.split(" ", 1)[1]
-        elif line.strip() == "" and cur_path:
-            items.append((cur_branch or "(detached)", Path(cur_path)))
-            cur_path, cur_branch = None, None
+def _build_worktree_index(worktrees: Iterable[tuple[str, Path]]) -> Mapping[str, Path]:
+    """Map each branch to the first worktree that has it checked out."""
+    index: dict[str, Path] = {}
+    for branch, path in worktrees:
+        index.setdefault(branch, path)
+    return MappingProxyType(index)
+
+
+@lru_cache(maxsize=64)
+def _worktree_index_cached(
+    repo: str, stamp: tuple[tuple[str, int, int], ...]
+) -> Mapping[str, Path]:
+    """Memoized worktree_index body; stamp only keys the cache."""
+    return _build_worktree_index(_parse_worktrees_cached(repo, stamp))
+
+
+def worktree_index(repo: Path) -> Mapping[str, Path]:
+    """
+    Get a read-only branch -> worktree path mapping for a repository.
 
-    if cur_path:
-        items.append((cur_branch or "(detached)", Path(cur_path)))
+    Shares parse_worktrees' invalidation stamp, so repeated branch lookups
+    within a command are dict probes rather than scans.
 
-    return items
+    Args:
+        repo: Repository path
+
+    Returns:
+        Mapping of full branch ref (or "(detached)") to worktree path
+    """
+    stamp = _worktrees_stamp(repo)
+    if stamp is None:
+        return _build_worktree_index(_iter_worktrees(repo))
+    return _worktree_index_cached(str(repo), stamp)
+
+
+def _build_worktree_path_index(
+    worktrees: Iterable[tuple[str | None, Path]],
+) -> Mapping[str, str | None]:
+    """Map each worktree's resolved path to its branch (first entry wins)."""
+    index: dict[str, str | None] = {}
+    for branch, path in worktrees:
+        index.setdefault(os.path.realpath(path), branch)
+    return MappingProxyType(index)
+
+
+@lru_cache(maxsize=64)
+def _worktree_path_index_cached(
+    repo: str, stamp: tuple[tuple[str, int, int], ...]
+) -> Mapping[str, str | None]:
+    """Memoized worktree_path_index body; stamp only keys the cache."""
+    return _build_worktree_path_index(_parse_worktree_branches_cached(repo, stamp))
+
+
+def worktree_path_index(repo: Path) -> Mapping[str, str | None]:
+    """
+    Get a read-only resolved worktree path -> branch mapping for a repository.
+
+    Paths are resolved once per listing, so callers only resolve the path
+    they are looking up. Shares parse_worktrees' invalidation stamp.
+
+    Args:
+        repo: Repository path
+
+    Returns:
+        Mapping of realpath string to branch name (None if detached)
+    """
+    stamp = _worktrees_stamp(repo)
+    if stamp is None:
+        return _build_worktree_path_index(parse_worktree_branches(repo))
+    return _worktree_path_index_cached(str(repo), stamp)
+
+
+def clear_worktree_cache() -> None:
+    """
+    Drop memoized worktree listings for all repositories.
+
+    Stale entries are never served (the stamp changes first), but clearing
+    at command start keeps long-running sessions from accumulating them.
+    """
+    _worktree_index_cached.cache_clear()
+    _worktree_path_index_cached.cache_clear()
+    _parse_worktree_branches_cached.cache_clear()
+    _parse_worktrees_cached.cache_clear()
 
 
 def find_worktree_by_branch(repo: Path, branch: str) -> Path | None:
@@ -304,10 +828,7 @@ def find_worktree_by_branch(repo: Path, branch: str) -> Path | None:
     Returns:
         Worktree path as Path object or None if not found
     """
-    for br, path in parse_worktrees(repo):
-        if br == branch:
-            return path
-    return None
+    return worktree_index(repo).get(branch)
 
 
 def find_worktree_by_name(repo: Path, worktree_name: str) -> Path | None:
@@ -321,10 +842,7 @@ def find_worktree_by_name(repo: Path, worktree_name: str) -> Path | None:
     Returns:
         Worktree path or None if not found
     """
-    for _, path in parse_worktrees(repo):
-        if path.name == worktree_name:
-            return path
-    return None
+    return next((path for _, path in _iter_worktrees(repo) if path.name == worktree_name), None)
 
 
 def find_worktree_by_intended_branch(repo: Path, intended_branch: str) -> Path | None:
@@ -368,6 +886,42 @@ def find_worktree_by_intended_branch(repo: Path, intended_branch: str) -> Path |
     if worktree_path:
         return worktree_path
 
+    return _find_worktree_by_intended_metadata(repo, intended_branch)
+
+
+def find_worktree_by_branch_or_name(repo: Path, target: str) -> tuple[Path | None, Path | None]:
+    """
+    Find worktrees matching target by intended branch and by directory name.
+
+    Equivalent to calling find_worktree_by_intended_branch and
+    find_worktree_by_name, but checks the current branch and the directory
+    name of each worktree in a single pass over the listing.
+
+    Args:
+        repo: Repository path
+        target: Branch name or worktree directory name
+
+    Returns:
+        tuple[Path | None, Path | None]: (branch_match, name_match)
+    """
+    intended_branch = normalize_branch_name(target)
+    branch_ref = f"refs/heads/{intended_branch}"
+    branch_match: Path | None = None
+    name_match: Path | None = None
+    for branch, path in _iter_worktrees(repo):
+        if branch_match is None and (branch == intended_branch or branch == branch_ref):
+            branch_match = path
+        if name_match is None and path.name == target:
+            name_match = path
+        if branch_match is not None and name_match is not None:
+            break
+    if branch_match is None:
+        branch_match = _find_worktree_by_intended_metadata(repo, intended_branch)
+    return branch_match, name_match
+
+
+def _find_worktree_by_intended_metadata(repo: Path, intended_branch: str) -> Path | None:
+    """Strategies 2 and 3 of find_worktree_by_intended_branch (no checked-out match)."""
     # Strategy 2: Search all intended branch metadata
     # This handles the case where a different branch is checked out
     result = git_command(
@@ -411,10 +965,11 @@ def find_worktree_by_intended_branch(repo: Path, intended_branch: str) -> Path |
 
     expected_path_suffix = f"{repo.name}-{sanitize_branch_name(intended_branch)}"
     worktrees = parse_worktrees(repo)
+    repo_resolved = repo.resolve()
     for _, path in worktrees:
         if path.name == expected_path_suffix:
             # Verify this isn't the main repository
-            if path.resolve() != repo.resolve():
+            if path != repo and path.resolve() != repo_resolved:
                 return path
 
     return None
@@ -424,15 +979,22 @@ def has_command(name: str) -> bool:
     """
     Check if a command is available in PATH.
 
+    Lookups are memoized per PATH value, so repeated checks don't re-walk
+    the search path.
+
     Args:
         name: Command name
 
     Returns:
         True if command exists, False otherwise
     """
-    from shutil import which
+    return _has_command_cached(name, os.environ.get("PATH", ""))
+
 
-    return bool(which(name))
+@lru_cache(maxsize=32)
+def _has_command_cached(name: str, path: str) -> bool:
+    """Memoized has_command body; path only keys the cache."""
+    return shutil.which(name, path=path or None) is not None
 
 
 def is_non_interactive() -> bool:
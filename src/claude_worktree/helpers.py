@@ -36,7 +36,7 @@ def get_worktree_metadata(branch: str, repo: Path) -> tuple[str, Path]:
         Created from: main
     """
     from .console import get_console
-    from .git_utils import branch_exists, parse_worktrees
+    from .git_utils import first_existing_branch, parse_worktrees
 
     base_branch = get_config(CONFIG_KEY_BASE_BRANCH.format(branch), repo)
     base_path_str = get_config(CONFIG_KEY_BASE_PATH.format(branch), repo)
@@ -70,20 +70,14 @@ def get_worktree_metadata(branch: str, repo: Path) -> tuple[str, Path]:
 
     # Step 2: Infer base_branch
     # Try common default branch names in order: main, master, develop
-    inferred_base_branch: str | None = None
-    for candidate in ["main", "master", "develop"]:
-        if branch_exists(candidate, inferred_base_path):
-            inferred_base_branch = candidate
-            break
+    inferred_base_branch = first_existing_branch(("main", "master", "develop"), inferred_base_path)
 
     # If no common branch found, use the branch of the first worktree (main repo)
     if not inferred_base_branch:
         if worktrees and worktrees[0][0] != "(detached)":
             first_branch = worktrees[0][0]
             # Normalize branch name (remove refs/heads/ prefix)
-            inferred_base_branch = (
-                first_branch[11:] if first_branch.startswith("refs/heads/") else first_branch
-            )
+            inferred_base_branch = first_branch.removeprefix("refs/heads/")
 
     if not inferred_base_branch:
         raise GitError(
@@ -1,5 +1,6 @@
 """AI tool integration operations for claude-worktree."""
 
+import json
 import os
 import shlex
 import subprocess
@@ -69,20 +70,21 @@ def _run_command_in_shell(
             return subprocess.run(["bash", "-lc", cmd], cwd=str(cwd), check=check)
 
 
-def _run_detached(cmd: str, cwd: str | Path) -> None:
+def _run_detached(cmd_parts: list[str], cwd: str | Path) -> None:
     """Run a command fully detached from the terminal.
 
     The process survives terminal close by using start_new_session (setsid)
-    and redirecting stdin/stdout/stderr to devnull.
+    and redirecting stdin/stdout/stderr to devnull. On Unix the tokenized
+    command is executed directly, without a login shell wrapper.
 
     Args:
-        cmd: Command string to execute
+        cmd_parts: Command and arguments as a list
         cwd: Working directory
     """
     if sys.platform == "win32":
         # On Windows, use CREATE_NEW_PROCESS_GROUP | DETACHED_PROCESS
         subprocess.Popen(
-            cmd,
+            " ".join(shlex.quote(part) for part in cmd_parts),
             cwd=str(cwd),
             shell=True,
             stdin=subprocess.DEVNULL,
@@ -92,7 +94,7 @@ def _run_detached(cmd: str, cwd: str | Path) -> None:
         )
     else:
         subprocess.Popen(
-            ["bash", "-lc", cmd],
+            cmd_parts,
             cwd=str(cwd),
             stdin=subprocess.DEVNULL,
             stdout=subprocess.DEVNULL,
@@ -134,23 +136,36 @@ def _generate_session_name(path: Path, branch_name: str | None = None) -> str:
 # =============================================================================
 
 
+def _applescript_string(text: str) -> str:
+    """Quote text as an AppleScript string literal.
+
+    JSON string escaping (backslash, double quote, control characters) is
+    compatible with AppleScript string literals.
+    """
+    return json.dumps(text, ensure_ascii=False)
+
+
+def _run_applescript(script: str) -> None:
+    """Run an AppleScript by piping it to osascript (no intermediate shell)."""
+    subprocess.run(["osascript", "-"], input=script, text=True, check=True)
+
+
 def _launch_iterm_window(path: Path, command: str, ai_tool_name: str) -> None:
     """Launch AI tool in new iTerm window."""
     if sys.platform != "darwin":
         raise GitError("--term iterm-window only works on macOS")
 
+    shell_line = _applescript_string(f"cd {shlex.quote(str(path))} && {command}")
     script = f"""
-    osascript <<'APPLESCRIPT'
-    tell application "iTerm"
-      activate
-      set newWindow to (create window with default profile)
-      tell current session of newWindow
-        write text "cd {shlex.quote(str(path))} && {command}"
-      end tell
-    end tell
-APPLESCRIPT
-    """
-    subprocess.run(["bash", "-lc", script], check=True)
+tell application "iTerm"
+  activate
+  set newWindow to (create window with default profile)
+  tell current session of newWindow
+    write text {shell_line}
+  end tell
+end tell
+"""
+    _run_applescript(script)
     console.print(f"[bold green]*[/bold green] {ai_tool_name} running in new iTerm window\n")
 
 
@@ -159,20 +174,19 @@ def _launch_iterm_tab(path: Path, command: str, ai_tool_name: str) -> None:
     if sys.platform != "darwin":
         raise GitError("--term iterm-tab only works on macOS")
 
+    shell_line = _applescript_string(f"cd {shlex.quote(str(path))} && {command}")
     script = f"""
-    osascript <<'APPLESCRIPT'
-    tell application "iTerm"
-      activate
-      tell current window
-        create tab with default profile
-        tell current session
-          write text "cd {shlex.quote(str(path))} && {command}"
-        end tell
-      end tell
+tell application "iTerm"
+  activate
+  tell current window
+    create tab with default profile
+    tell current session
+      write text {shell_line}
     end tell
-APPLESCRIPT
-    """
-    subprocess.run(["bash", "-lc", script], check=True)
+  end tell
+end tell
+"""
+    _run_applescript(script)
     console.print(f"[bold green]*[/bold green] {ai_tool_name} running in new iTerm tab\n")
 
 
@@ -182,20 +196,19 @@ def _launch_iterm_pane(path: Path, command: str, ai_tool_name: str, horizontal:
         raise GitError("--term iterm-pane-* only works on macOS")
 
     direction = "horizontally" if horizontal else "vertically"
+    shell_line = _applescript_string(f"cd {shlex.quote(str(path))} && {command}")
     script = f"""
-    osascript <<'APPLESCRIPT'
-    tell application "iTerm"
-      activate
-      tell current session of current window
-        split {direction} with default profile
-      end tell
-      tell last session of current tab of current window
-        write text "cd {shlex.quote(str(path))} && {command}"
-      end tell
-    end tell
-APPLESCRIPT
-    """
-    subprocess.run(["bash", "-lc", script], check=True)
+tell application "iTerm"
+  activate
+  tell current session of current window
+    split {direction} with default profile
+  end tell
+  tell last session of current tab of current window
+    write text {shell_line}
+  end tell
+end tell
+"""
+    _run_applescript(script)
     pane_type = "horizontal" if horizontal else "vertical"
     console.print(f"[bold green]*[/bold green] {ai_tool_name} running in iTerm {pane_type} pane\n")
 
@@ -531,7 +544,7 @@ def launch_ai_tool(
             console.print(f"[cyan]Starting {ai_tool_name} (Ctrl+C to exit)...[/cyan]\n")
             _run_command_in_shell(cmd, path, background=False, check=False)
         case LaunchMethod.DETACH:
-            _run_detached(cmd, path)
+            _run_detached(cmd_parts, path)
             console.print(f"[bold green]*[/bold green] {ai_tool_name} detached (survives terminal close)\n")
         # iTerm
         case LaunchMethod.ITERM_WINDOW:
@@ -1,16 +1,117 @@
 """Diagnostic operations for claude-worktree."""
 
+import re
 import subprocess
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from functools import partial
 from pathlib import Path
-
-from packaging.version import parse
+from typing import TypeVar
 
 from ..console import get_console
 from ..constants import CONFIG_KEY_BASE_BRANCH
-from ..git_utils import get_config, get_feature_worktrees, get_repo_root, git_command
+from ..git_utils import get_feature_worktrees, get_git_dir, get_repo_root, git_command
 
 console = get_console()
 
+_T = TypeVar("_T")
+
+# Minimum supported git version
+_MIN_GIT_VERSION = (2, 31, 0)
+_MIN_GIT_VERSION_STR = ".".join(map(str, _MIN_GIT_VERSION))
+
+# In-flight git probes keyed by (operation, worktree path). A re-entered health
+# check (e.g. a live refresh) joins the running probe instead of forking again.
+_inflight: dict[tuple[str, Path], Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _get_or_create_inflight(key: tuple[str, Path], probe: Callable[[], _T]) -> _T:
+    """
+    Run a probe once per key, sharing its result with concurrent callers.
+
+    Args:
+        key: (operation, worktree path) identifying the probe
+        probe: Callable that performs the git operation
+
+    Returns:
+        Result of the probe (shared if another caller is already running it)
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if future is None:
+            future = Future()
+            _inflight[key] = future
+
+    if not owner:
+        return future.result()  # type: ignore[no-any-return]
+
+    try:
+        result = probe()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def _git_version_tuple(version: str) -> tuple[int, ...]:
+    """
+    Convert a git version string into a comparable integer tuple.
+
+    Args:
+        version: Version string (e.g., "2.39.0" or "2.39.0.windows.1")
+
+    Returns:
+        Up to three leading numeric components (e.g., (2, 39, 0))
+
+    Raises:
+        ValueError: If the string has no leading numeric components
+    """
+    parts = tuple(int(part) for part in version.split(".")[:3] if part.isdigit())
+    if not parts:
+        raise ValueError(f"Unrecognized git version: {version}")
+    return parts
+
+
+def _get_base_branches(repo: Path) -> dict[str, str]:
+    """
+    Read base branch metadata for all branches with a single git config call.
+
+    Args:
+        repo: Repository path
+
+    Returns:
+        Dictionary of feature branch name → base branch name
+    """
+    # Git reports section and variable names in lowercase; the subsection
+    # (branch name) keeps its case.
+    prefix, suffix = CONFIG_KEY_BASE_BRANCH.lower().split("{}")
+    result = git_command(
+        "config",
+        "--local",
+        "--get-regexp",
+        f"^{re.escape(prefix)}.*{re.escape(suffix)}$",
+        repo=repo,
+        capture=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return {}
+
+    base_branches: dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        if key.startswith(prefix) and key.endswith(suffix) and value:
+            base_branches[key[len(prefix) : -len(suffix)]] = value
+    return base_branches
+
 
 def doctor() -> None:
     """
@@ -46,13 +147,16 @@ def doctor() -> None:
             version_str = parts[2]
         else:
             version_str = parts[-1]
-        git_version = parse(version_str)
-        min_version = parse("2.31.0")
+        git_version = _git_version_tuple(version_str)
 
-        if git_version >= min_version:
-            console.print(f"   [green]*[/green] Git version {version_str} (minimum: 2.31.0)")
+        if git_version >= _MIN_GIT_VERSION:
+            console.print(
+                f"   [green]*[/green] Git version {version_str} (minimum: {_MIN_GIT_VERSION_STR})"
+            )
         else:
-            console.print(f"   [red]x[/red] Git version {version_str} is too old (minimum: 2.31.0)")
+            console.print(
+                f"   [red]x[/red] Git version {version_str} is too old (minimum: {_MIN_GIT_VERSION_STR})"
+            )
             issues_found += 1
     except Exception as e:
         console.print(f"   [red]x[/red] Could not detect Git version: {e}")
@@ -64,23 +168,26 @@ def doctor() -> None:
     console.print("[bold]2. Checking worktree accessibility...[/bold]")
     worktrees: list[tuple[str, Path, str]] = []
     stale_count = 0
+    lines: list[str] = []
+    cwd = Path.cwd()
     for branch_name, path in get_feature_worktrees(repo):
-        status = get_worktree_status(str(path), repo)
+        status = get_worktree_status(str(path), repo, cwd)
         worktrees.append((branch_name, path, status))
 
         if status == "stale":
             stale_count += 1
-            console.print(f"   [red]x[/red] {branch_name}: Stale (directory missing)")
+            lines.append(f"   [red]x[/red] {branch_name}: Stale (directory missing)")
             issues_found += 1
 
     if stale_count == 0:
-        console.print(f"   [green]*[/green] All {len(worktrees)} worktrees are accessible")
+        lines.append(f"   [green]*[/green] All {len(worktrees)} worktrees are accessible")
     else:
-        console.print(
+        lines.append(
             f"   [yellow]![/yellow] {stale_count} stale worktree(s) found (use 'cw prune')"
         )
 
-    console.print()
+    lines.append("")
+    console.print("\n".join(lines))
 
     # 3. Check for uncommitted changes
     console.print("[bold]3. Checking for uncommitted changes...[/bold]")
@@ -89,12 +196,18 @@ def doctor() -> None:
         if status in ["modified", "active"]:
             # Check if there are actual uncommitted changes
             try:
-                diff_result = git_command(
-                    "status",
-                    "--porcelain",
-                    repo=path,
-                    capture=True,
-                    check=False,
+                diff_result = _get_or_create_inflight(
+                    ("status", path),
+                    partial(
+                        git_command,
+                        "status",
+                        "--porcelain",
+                        repo=path,
+                        capture=True,
+                        check=False,
+                        read_only=True,
+                        gitdir=get_git_dir(path),
+                    ),
                 )
                 if diff_result.returncode == 0 and diff_result.stdout.strip():
                     dirty_worktrees.append((branch_name, path))
@@ -102,89 +215,79 @@ def doctor() -> None:
                 pass
 
     if dirty_worktrees:
-        console.print(
+        lines = [
             f"   [yellow]![/yellow] {len(dirty_worktrees)} worktree(s) with uncommitted changes:"
-        )
-        for branch_name, _path in dirty_worktrees:
-            console.print(f"      • {branch_name}")
+        ]
+        lines += [f"      • {branch_name}" for branch_name, _path in dirty_worktrees]
         warnings_found += 1
     else:
-        console.print("   [green]*[/green] No uncommitted changes")
+        lines = ["   [green]*[/green] No uncommitted changes"]
 
-    console.print()
+    lines.append("")
+    console.print("\n".join(lines))
 
     # 4. Check if worktrees are behind base branch
     console.print("[bold]4. Checking if worktrees are behind base branch...[/bold]")
     behind_worktrees: list[tuple[str, str, str]] = []
+    fetched = False
+    base_branches = _get_base_branches(repo)
     for branch_name, path, status in worktrees:
         if status == "stale":
             continue
 
         # Get base branch metadata
-        base_branch = get_config(CONFIG_KEY_BASE_BRANCH.format(branch_name), repo)
+        base_branch = base_branches.get(branch_name)
         if not base_branch:
             continue
 
         try:
-            # Fetch to get latest remote refs
-            git_command("fetch", "--all", "--prune", repo=path, check=False)
-
-            # Check if branch is behind origin/base
-            merge_base_result = git_command(
-                "merge-base",
-                branch_name,
-                f"origin/{base_branch}",
-                repo=path,
-                capture=True,
-                check=False,
-            )
-            if merge_base_result.returncode != 0:
-                continue
-
-            merge_base = merge_base_result.stdout.strip()
-
-            # Get current commit of base branch
-            base_commit_result = git_command(
-                "rev-parse",
-                f"origin/{base_branch}",
-                repo=path,
-                capture=True,
-                check=False,
-            )
-            if base_commit_result.returncode != 0:
-                continue
-
-            base_commit = base_commit_result.stdout.strip()
+            # Fetch latest remote refs once; worktrees share the main repo's refs
+            if not fetched:
+                _get_or_create_inflight(
+                    ("fetch", repo),
+                    partial(git_command, "fetch", "--all", "--prune", repo=repo, check=False),
+                )
+                fetched = True
 
-            # If merge base != base commit, then we're behind
-            if merge_base != base_commit:
-                # Count commits behind
-                behind_count_result = git_command(
+            # Count commits ahead/behind origin/base in a single rev-list pass
+            ahead_behind_result = _get_or_create_inflight(
+                ("rev-list", path),
+                partial(
+                    git_command,
                     "rev-list",
+                    "--left-right",
                     "--count",
-                    f"{branch_name}..origin/{base_branch}",
+                    f"{branch_name}...origin/{base_branch}",
                     repo=path,
                     capture=True,
                     check=False,
-                )
-                if behind_count_result.returncode == 0:
-                    behind_count = behind_count_result.stdout.strip()
-                    behind_worktrees.append((branch_name, base_branch, behind_count))
+                    read_only=True,
+                    gitdir=get_git_dir(path),
+                ),
+            )
+            if ahead_behind_result.returncode != 0:
+                continue
+
+            # Output format: "<ahead>\t<behind>"
+            _ahead, _, behind_count = ahead_behind_result.stdout.strip().partition("\t")
+            if behind_count and int(behind_count) > 0:
+                behind_worktrees.append((branch_name, base_branch, behind_count))
         except Exception:
             pass
 
     if behind_worktrees:
-        console.print(
-            f"   [yellow]![/yellow] {len(behind_worktrees)} worktree(s) behind base branch:"
-        )
-        for branch_name, base_branch, count in behind_worktrees:
-            console.print(f"      • {branch_name}: {count} commit(s) behind {base_branch}")
-        console.print("   [dim]Tip: Use 'cw sync --all' to update all worktrees[/dim]")
+        lines = [f"   [yellow]![/yellow] {len(behind_worktrees)} worktree(s) behind base branch:"]
+        lines += [
+            f"      • {branch_name}: {count} commit(s) behind {base_branch}"
+            for branch_name, base_branch, count in behind_worktrees
+        ]
+        lines.append("   [dim]Tip: Use 'cw sync --all' to update all worktrees[/dim]")
         warnings_found += 1
     else:
-        console.print("   [green]*[/green] All worktrees are up-to-date with base")
+        lines = ["   [green]*[/green] All worktrees are up-to-date with base"]
 
-    console.print()
+    lines.append("")
+    console.print("\n".join(lines))
 
     # 5. Check for existing merge conflicts
     console.print("[bold]5. Checking for merge conflicts...[/bold]")
@@ -195,13 +298,19 @@ def doctor() -> None:
 
         try:
             # Check for unmerged files (conflicts)
-            conflicts_result = git_command(
-                "diff",
-                "--name-only",
-                "--diff-filter=U",
-                repo=path,
-                capture=True,
-                check=False,
+            conflicts_result = _get_or_create_inflight(
+                ("diff-filter=U", path),
+                partial(
+                    git_command,
+                    "diff",
+                    "--name-only",
+                    "--diff-filter=U",
+                    repo=path,
+                    capture=True,
+                    check=False,
+                    read_only=True,
+                    gitdir=get_git_dir(path),
+                ),
             )
             if conflicts_result.returncode == 0 and conflicts_result.stdout.strip():
                 conflicted_files = conflicts_result.stdout.strip().splitlines()
@@ -210,42 +319,40 @@ def doctor() -> None:
             pass
 
     if conflicted_worktrees:
-        console.print(
-            f"   [red]x[/red] {len(conflicted_worktrees)} worktree(s) with merge conflicts:"
-        )
-        for branch_name, files in conflicted_worktrees:
-            console.print(f"      • {branch_name}: {len(files)} conflicted file(s)")
-        console.print("   [dim]Tip: Use 'cw finish --ai-merge' for AI-assisted resolution[/dim]")
+        lines = [f"   [red]x[/red] {len(conflicted_worktrees)} worktree(s) with merge conflicts:"]
+        lines += [
+            f"      • {branch_name}: {len(files)} conflicted file(s)"
+            for branch_name, files in conflicted_worktrees
+        ]
+        lines.append("   [dim]Tip: Use 'cw finish --ai-merge' for AI-assisted resolution[/dim]")
         issues_found += 1
     else:
-        console.print("   [green]*[/green] No merge conflicts detected")
+        lines = ["   [green]*[/green] No merge conflicts detected"]
 
-    console.print()
+    lines.append("")
 
     # Summary
-    console.print("[bold cyan]Summary:[/bold cyan]")
+    lines.append("[bold cyan]Summary:[/bold cyan]")
     if issues_found == 0 and warnings_found == 0:
-        console.print("[bold green]* Everything looks healthy![/bold green]\n")
+        lines += ["[bold green]* Everything looks healthy![/bold green]", ""]
     else:
         if issues_found > 0:
-            console.print(f"[bold red]x {issues_found} issue(s) found[/bold red]")
+            lines.append(f"[bold red]x {issues_found} issue(s) found[/bold red]")
         if warnings_found > 0:
-            console.print(f"[bold yellow]! {warnings_found} warning(s) found[/bold yellow]")
-        console.print()
+            lines.append(f"[bold yellow]! {warnings_found} warning(s) found[/bold yellow]")
+        lines.append("")
 
     # Recommendations
+    recommendations: list[str] = []
     if stale_count > 0:
-        console.print("[bold]Recommendations:[/bold]")
-        console.print("  • Run [cyan]cw prune[/cyan] to clean up stale worktrees")
+        recommendations.append("  • Run [cyan]cw prune[/cyan] to clean up stale worktrees")
     if behind_worktrees:
-        if not stale_count:
-            console.print("[bold]Recommendations:[/bold]")
-        console.print("  • Run [cyan]cw sync --all[/cyan] to update all worktrees")
+        recommendations.append("  • Run [cyan]cw sync --all[/cyan] to update all worktrees")
     if conflicted_worktrees:
-        if not stale_count and not behind_worktrees:
-            console.print("[bold]Recommendations:[/bold]")
-        console.print("  • Resolve conflicts in conflicted worktrees")
-        console.print("  • Use [cyan]cw finish --ai-merge[/cyan] for AI assistance")
+        recommendations.append("  • Resolve conflicts in conflicted worktrees")
+        recommendations.append("  • Use [cyan]cw finish --ai-merge[/cyan] for AI assistance")
+
+    if recommendations:
+        lines += ["[bold]Recommendations:[/bold]", *recommendations, ""]
 
-    if stale_count > 0 or behind_worktrees or conflicted_worktrees:
-        console.print()
+    console.print("\n".join(lines))
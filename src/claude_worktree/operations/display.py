@@ -1,8 +1,13 @@
 """Display and information operations for claude-worktree."""
 
+import heapq
 import os
 import shutil
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 from ..console import get_console
@@ -13,9 +18,10 @@ from ..git_utils import (
     get_config,
     get_current_branch,
     get_feature_worktrees,
+    get_git_dir,
     get_repo_root,
     git_command,
-    normalize_branch_name,
+    git_stream_lines,
     parse_worktrees,
 )
 
@@ -29,23 +35,50 @@ STATUS_COLORS: dict[str, str] = {
     "stale": "red",
 }
 
+# Status → icon mapping (used by tree and stats)
+_STATUS_ICONS: dict[str, str] = {
+    "active": "●",  # current worktree
+    "clean": "○",  # clean
+    "modified": "◉",  # has changes
+    "stale": "x",  # directory missing
+}
+
 
 # Minimum terminal width for table layout (below this → compact layout)
 _MIN_TABLE_WIDTH = 100
 
+# Nanoseconds per hour/day, for converting st_mtime_ns to ages
+_HOUR_NS = 3600 * 10**9
+_DAY_NS = 24 * _HOUR_NS
+
+# Maximum concurrent `git status` probes when listing worktrees
+_STATUS_WORKERS = 8
+
+# `git diff --name-status` letter → (Rich color, description)
+_DIFF_STATUS_TABLE: dict[str, tuple[str, str]] = {
+    "M": ("yellow", "Modified"),
+    "A": ("green", "Added"),
+    "D": ("red", "Deleted"),
+    "R": ("cyan", "Renamed"),
+    "C": ("cyan", "Copied"),
+}
+_DIFF_STATUS_DEFAULT = ("white", "Changed")
+
 
 def _get_terminal_width() -> int:
     """Return current terminal width."""
     return shutil.get_terminal_size((80, 24)).columns
 
 
-def get_worktree_status(path: str, repo: Path) -> str:
+def get_worktree_status(path: str, repo: Path, cwd: Path | None = None) -> str:
     """
     Determine the status of a worktree.
 
     Args:
         path: Absolute path to the worktree directory
         repo: Repository root path
+        cwd: Current working directory (computed if not given; pass it when
+            probing many worktrees to avoid repeated getcwd calls)
 
     Returns:
         Status string: "stale", "active", "modified", or "clean"
@@ -56,14 +89,23 @@ def get_worktree_status(path: str, repo: Path) -> str:
     if not path_obj.exists():
         return "stale"
 
-    # Check if currently in this worktree
-    cwd = str(Path.cwd())
-    if cwd.startswith(path):
+    # Check if currently in this worktree (component-wise, so /a/b ≠ /a/bc)
+    if cwd is None:
+        cwd = Path.cwd()
+    if cwd.is_relative_to(path_obj):
         return "active"
 
     # Check for uncommitted changes
     try:
-        result = git_command("status", "--porcelain", repo=path_obj, capture=True, check=False)
+        result = git_command(
+            "status",
+            "--porcelain",
+            repo=path_obj,
+            capture=True,
+            check=False,
+            read_only=True,
+            gitdir=get_git_dir(path_obj),
+        )
         if result.returncode == 0 and result.stdout.strip():
             return "modified"
     except Exception:
@@ -73,6 +115,23 @@ def get_worktree_status(path: str, repo: Path) -> str:
     return "clean"
 
 
+def _relative_path(path: Path, start: Path) -> str:
+    """
+    Return path relative to start for display.
+
+    Paths lexically under start are sliced directly; anything else goes
+    through os.path.relpath. Falls back to the absolute path when no
+    relative path exists (e.g. different drives on Windows).
+    """
+    path_str, start_str = str(path), str(start)
+    if path_str.startswith(start_str + os.sep):
+        return path_str[len(start_str) + 1 :]
+    try:
+        return os.path.relpath(path_str, start_str)
+    except ValueError:
+        return path_str
+
+
 def list_worktrees() -> None:
     """List all worktrees for the current repository."""
     repo = get_repo_root()
@@ -80,20 +139,24 @@ def list_worktrees() -> None:
 
     console.print(f"\n[bold cyan]Worktrees for repository:[/bold cyan] {repo}\n")
 
+    # Probe statuses concurrently; map() preserves the original worktree order
+    cwd = Path.cwd()
+    with ThreadPoolExecutor(max_workers=_STATUS_WORKERS) as executor:
+        statuses = list(
+            executor.map(lambda item: get_worktree_status(str(item[1]), repo, cwd), worktrees)
+        )
+
     # Collect worktree data for display
     worktree_data: list[tuple[str, str, str, str, str]] = []
-    for branch, path in worktrees:
-        current_branch = normalize_branch_name(branch)
-        status = get_worktree_status(str(path), repo)
-        rel_path = os.path.relpath(str(path), repo)
+    now_ns = time.time_ns()
+    for (branch, path), status in zip(worktrees, statuses, strict=True):
+        current_branch = branch.removeprefix("refs/heads/")
+        rel_path = _relative_path(path, repo)
 
-        # Compute age
+        # Compute age (missing directories simply have no age)
         age_str = ""
         try:
-            if path.exists():
-                mtime = path.stat().st_mtime
-                age_days = (time.time() - mtime) / (24 * 3600)
-                age_str = format_age(age_days)
+            age_str = _format_age_hours((now_ns - path.stat().st_mtime_ns) // _HOUR_NS)
         except OSError:
             pass
 
@@ -141,13 +204,11 @@ def list_worktrees() -> None:
     # Count feature worktrees (exclude main repo entry)
     feature_count = len(worktree_data) - 1 if len(worktree_data) > 1 else 0
     if feature_count > 0:
-        status_counts: dict[str, int] = {}
-        for _, _, status, _, _ in worktree_data:
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = Counter(status for _, _, status, _, _ in worktree_data)
 
         summary_parts: list[str] = []
         for status_name in ("clean", "modified", "active", "stale"):
-            count = status_counts.get(status_name, 0)
+            count = status_counts[status_name]
             if count > 0:
                 color = STATUS_COLORS.get(status_name, "white")
                 summary_parts.append(f"[{color}]{count} {status_name}[/{color}]")
@@ -169,11 +230,11 @@ def _print_worktree_table(
     worktree_col_width = min(max(max_worktree_len + 2, 20), 35)
     branch_col_width = min(max(max_branch_len + 2, 20), 35)
 
-    console.print(
+    lines = [
         f"{'WORKTREE':<{worktree_col_width}} {'CURRENT BRANCH':<{branch_col_width}} "
-        f"{'STATUS':<10} {'AGE':<12} PATH"
-    )
-    console.print("─" * (worktree_col_width + branch_col_width + 72))
+        f"{'STATUS':<10} {'AGE':<12} PATH",
+        "─" * (worktree_col_width + branch_col_width + 72),
+    ]
 
     for worktree_id, current_branch, status, age_str, rel_path in worktree_data:
         color = STATUS_COLORS.get(status, "white")
@@ -183,27 +244,33 @@ def _print_worktree_table(
         else:
             branch_display = current_branch
 
-        console.print(
+        lines.append(
             f"{worktree_id:<{worktree_col_width}} {branch_display:<{branch_col_width}} "
             f"[{color}]{status:<10}[/{color}] {age_str:<12} {rel_path}"
         )
 
+    console.print("\n".join(lines))
+
 
 def _print_worktree_compact(
     worktree_data: list[tuple[str, str, str, str, str]],
 ) -> None:
     """Print worktree data in compact format for narrow terminals."""
+    lines: list[str] = []
     for worktree_id, current_branch, status, age_str, rel_path in worktree_data:
         color = STATUS_COLORS.get(status, "white")
         age_part = f"  {age_str}" if age_str else ""
 
-        console.print(f"  [bold]{worktree_id}[/bold]  [{color}]{status}[/{color}]{age_part}")
+        lines.append(f"  [bold]{worktree_id}[/bold]  [{color}]{status}[/{color}]{age_part}")
 
         details: list[str] = []
         if worktree_id != current_branch:
             details.append(f"branch: [yellow]{current_branch} (⚠️)[/yellow]")
         details.append(f"path: {rel_path}")
-        console.print(f"    {' · '.join(details)}")
+        lines.append(f"    {' · '.join(details)}")
+
+    if lines:
+        console.print("\n".join(lines))
 
 
 def show_status() -> None:
@@ -247,24 +314,16 @@ def show_tree() -> None:
     # Get feature worktrees (excludes main repo and detached entries)
     feature_worktrees = []
     for branch_name, path in get_feature_worktrees(repo):
-        status = get_worktree_status(str(path), repo)
-        is_current = str(cwd).startswith(str(path))
+        status = get_worktree_status(str(path), repo, cwd)
+        is_current = cwd.is_relative_to(path)
         feature_worktrees.append((branch_name, path, status, is_current))
 
     if not feature_worktrees:
         console.print("[dim]  (no feature worktrees)[/dim]\n")
         return
 
-    # Status icons
-    status_icons = {
-        "active": "●",  # current worktree
-        "clean": "○",  # clean
-        "modified": "◉",  # has changes
-        "stale": "x",  # directory missing
-    }
-
     # Sort by branch name for consistent display
-    feature_worktrees.sort(key=lambda x: x[0])
+    feature_worktrees.sort(key=itemgetter(0))
 
     # Draw tree
     for i, (branch_name, path, status, is_current) in enumerate(feature_worktrees):
@@ -272,7 +331,7 @@ def show_tree() -> None:
         prefix = "└── " if is_last else "├── "
 
         # Status icon and color
-        icon = status_icons.get(status, "○")
+        icon = _STATUS_ICONS.get(status, "○")
         color = STATUS_COLORS.get(status, "white")
 
         # Highlight current worktree
@@ -303,6 +362,91 @@ def show_tree() -> None:
     console.print("  [bold green]★[/bold green] currently active worktree\n")
 
 
+def _get_branch_tips(repo: Path) -> dict[str, str]:
+    """
+    Map every local branch to its tip commit SHA with one git call.
+
+    Args:
+        repo: Repository root path
+
+    Returns:
+        Dictionary of branch name → tip SHA
+    """
+    result = git_command(
+        "for-each-ref",
+        # lstrip=2 stays "<name>" even when a tag shares the branch name
+        "--format=%(refname:lstrip=2)\t%(objectname)",
+        "refs/heads/",
+        repo=repo,
+        capture=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return {}
+
+    tips: dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        branch, _, sha = line.partition("\t")
+        if sha:
+            tips[branch] = sha
+    return tips
+
+
+@lru_cache(maxsize=256)
+def _count_commits(tip: str, repo: Path) -> int:
+    """
+    Count commits reachable from a tip SHA.
+
+    Memoized by SHA: a commit's history never changes, so unchanged branches
+    skip the git call entirely.
+
+    Args:
+        tip: Commit SHA
+        repo: Repository containing the commit
+
+    Returns:
+        Number of commits, or 0 if it cannot be determined
+    """
+    result = git_command(
+        "rev-list", "--count", tip, repo=repo, capture=True, check=False, read_only=True
+    )
+    if result.returncode != 0:
+        return 0
+    try:
+        return int(result.stdout.strip())
+    except ValueError:
+        return 0
+
+
+def _scan_worktree_dirs(paths: list[Path]) -> dict[Path, os.DirEntry[str]]:
+    """
+    Look up directory entries for worktree paths, one scandir per parent.
+
+    DirEntry caches the file type from the directory listing, so existence
+    checks do not need a separate stat call per worktree.
+
+    Args:
+        paths: Worktree paths
+
+    Returns:
+        Dictionary of path → DirEntry for paths that exist
+    """
+    wanted: dict[Path, set[str]] = {}
+    for path in paths:
+        wanted.setdefault(path.parent, set()).add(path.name)
+
+    entries: dict[Path, os.DirEntry[str]] = {}
+    for parent, names in wanted.items():
+        try:
+            with os.scandir(parent) as it:
+                for entry in it:
+                    if entry.name in names:
+                        entries[parent / entry.name] = entry
+        except OSError:
+            continue
+    return entries
+
+
 def show_stats() -> None:
     """
     Display usage analytics for worktrees.
@@ -317,29 +461,25 @@ def show_stats() -> None:
 
     # Collect worktree data (excludes main repo and detached entries)
     worktree_data: list[tuple[str, Path, str, float, int]] = []
-    for branch_name, path in get_feature_worktrees(repo):
-        status = get_worktree_status(str(path), repo)
+    branch_tips = _get_branch_tips(repo)
+    feature_worktrees = get_feature_worktrees(repo)
+    dir_entries = _scan_worktree_dirs([path for _, path in feature_worktrees])
+    now_ns = time.time_ns()
+    cwd = Path.cwd()
+    for branch_name, path in feature_worktrees:
+        status = get_worktree_status(str(path), repo, cwd)
 
         # Get creation time (directory mtime)
         try:
-            if path.exists():
-                creation_time = path.stat().st_mtime
-                age_days = (time.time() - creation_time) / (24 * 3600)
-
-                # Count commits in this worktree
-                try:
-                    commit_count_result = git_command(
-                        "rev-list", "--count", branch_name, repo=path, capture=True, check=False
-                    )
-                    commit_count = (
-                        int(commit_count_result.stdout.strip())
-                        if commit_count_result.returncode == 0
-                        else 0
-                    )
-                except Exception:
-                    commit_count = 0
+            entry = dir_entries.get(path)
+            if entry is not None and entry.is_dir():
+                creation_time_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+                age_days = (now_ns - creation_time_ns) / _DAY_NS
+
+                # Count commits on this worktree's branch
+                tip = branch_tips.get(branch_name)
+                commit_count = _count_commits(tip, repo) if tip else 0
             else:
-                creation_time = 0.0
                 age_days = 0.0
                 commit_count = 0
 
@@ -355,19 +495,17 @@ def show_stats() -> None:
 
     # Overall statistics
     total_count = len(worktree_data)
-    status_counts = {"clean": 0, "modified": 0, "active": 0, "stale": 0}
-    for _, _, status, _, _ in worktree_data:
-        status_counts[status] = status_counts.get(status, 0) + 1
-
-    console.print("[bold]Overview:[/bold]")
-    console.print(f"  Total worktrees: {total_count}")
-    console.print(
-        f"  Status: [green]{status_counts.get('clean', 0)} clean[/green], "
-        f"[yellow]{status_counts.get('modified', 0)} modified[/yellow], "
-        f"[bold green]{status_counts.get('active', 0)} active[/bold green], "
-        f"[red]{status_counts.get('stale', 0)} stale[/red]"
-    )
-    console.print()
+    status_counts = Counter(status for _, _, status, _, _ in worktree_data)
+
+    lines = [
+        "[bold]Overview:[/bold]",
+        f"  Total worktrees: {total_count}",
+        f"  Status: [green]{status_counts['clean']} clean[/green], "
+        f"[yellow]{status_counts['modified']} modified[/yellow], "
+        f"[bold green]{status_counts['active']} active[/bold green], "
+        f"[red]{status_counts['stale']} stale[/red]",
+        "",
+    ]
 
     # Age statistics
     ages = [age for _, _, _, age, _ in worktree_data if age > 0]
@@ -376,11 +514,13 @@ def show_stats() -> None:
         oldest_age = max(ages)
         newest_age = min(ages)
 
-        console.print("[bold]Age Statistics:[/bold]")
-        console.print(f"  Average age: {avg_age:.1f} days")
-        console.print(f"  Oldest: {oldest_age:.1f} days")
-        console.print(f"  Newest: {newest_age:.1f} days")
-        console.print()
+        lines += [
+            "[bold]Age Statistics:[/bold]",
+            f"  Average age: {avg_age:.1f} days",
+            f"  Oldest: {oldest_age:.1f} days",
+            f"  Newest: {newest_age:.1f} days",
+            "",
+        ]
 
     # Commit statistics
     commits = [count for _, _, _, _, count in worktree_data if count > 0]
@@ -389,58 +529,63 @@ def show_stats() -> None:
         avg_commits = total_commits / len(commits)
         max_commits = max(commits)
 
-        console.print("[bold]Commit Statistics:[/bold]")
-        console.print(f"  Total commits across all worktrees: {total_commits}")
-        console.print(f"  Average commits per worktree: {avg_commits:.1f}")
-        console.print(f"  Most commits in a worktree: {max_commits}")
-        console.print()
+        lines += [
+            "[bold]Commit Statistics:[/bold]",
+            f"  Total commits across all worktrees: {total_commits}",
+            f"  Average commits per worktree: {avg_commits:.1f}",
+            f"  Most commits in a worktree: {max_commits}",
+            "",
+        ]
+
+    console.print("\n".join(lines))
 
     # Top worktrees by age
-    console.print("[bold]Oldest Worktrees:[/bold]")
-    sorted_by_age = sorted(worktree_data, key=lambda x: x[3], reverse=True)[:5]
+    lines = ["[bold]Oldest Worktrees:[/bold]"]
+    sorted_by_age = heapq.nlargest(5, worktree_data, key=itemgetter(3))
     for branch_name, _path, status, age_days, _ in sorted_by_age:
         if age_days > 0:
-            status_icon = {"clean": "○", "modified": "◉", "active": "●", "stale": "x"}.get(
-                status, "○"
-            )
+            status_icon = _STATUS_ICONS.get(status, "○")
             status_color = STATUS_COLORS.get(status, "white")
             age_str = format_age(age_days)
-            console.print(
+            lines.append(
                 f"  [{status_color}]{status_icon}[/{status_color}] {branch_name:<30} {age_str}"
             )
-    console.print()
+    lines.append("")
+    console.print("\n".join(lines))
 
     # Most active worktrees by commit count
-    console.print("[bold]Most Active Worktrees (by commits):[/bold]")
-    sorted_by_commits = sorted(worktree_data, key=lambda x: x[4], reverse=True)[:5]
+    lines = ["[bold]Most Active Worktrees (by commits):[/bold]"]
+    sorted_by_commits = heapq.nlargest(5, worktree_data, key=itemgetter(4))
     for branch_name, _path, status, _age_days, commit_count in sorted_by_commits:
         if commit_count > 0:
-            status_icon = {"clean": "○", "modified": "◉", "active": "●", "stale": "x"}.get(
-                status, "○"
-            )
+            status_icon = _STATUS_ICONS.get(status, "○")
             status_color = STATUS_COLORS.get(status, "white")
-            console.print(
+            lines.append(
                 f"  [{status_color}]{status_icon}[/{status_color}] {branch_name:<30} {commit_count} commits"
             )
-    console.print()
+    lines.append("")
+    console.print("\n".join(lines))
 
 
 def format_age(age_days: float) -> str:
     """Format age in days to human-readable string."""
-    if age_days < 1:
-        hours = int(age_days * 24)
+    return _format_age_hours(int(age_days * 24))
+
+
+@lru_cache(maxsize=256)
+def _format_age_hours(hours: int) -> str:
+    """Format a whole-hour age; memoized since many worktrees share a bucket."""
+    if hours < 24:
         return f"{hours}h ago" if hours > 0 else "just now"
-    elif age_days < 7:
-        return f"{int(age_days)}d ago"
-    elif age_days < 30:
-        weeks = int(age_days / 7)
-        return f"{weeks}w ago"
-    elif age_days < 365:
-        months = int(age_days / 30)
-        return f"{months}mo ago"
+    days = hours // 24
+    if days < 7:
+        return f"{days}d ago"
+    elif days < 30:
+        return f"{days // 7}w ago"
+    elif days < 365:
+        return f"{days // 30}mo ago"
     else:
-        years = int(age_days / 365)
-        return f"{years}y ago"
+        return f"{days // 365}y ago"
 
 
 def diff_worktrees(branch1: str, branch2: str, summary: bool = False, files: bool = False) -> None:
@@ -481,30 +626,19 @@ def diff_worktrees(branch1: str, branch2: str, summary: bool = False, files: boo
         )
         console.print("[bold]Changed files:[/bold]\n")
         if result.stdout.strip():
+            # Format: "<status>\t<file>" (e.g. "M\tfile.txt", "R100\told\tnew")
+            lookup = _DIFF_STATUS_TABLE.get
+            lines: list[str] = []
             for line in result.stdout.strip().splitlines():
-                # Format: M  file.txt (Modified)
-                # Format: A  file.txt (Added)
-                # Format: D  file.txt (Deleted)
-                parts = line.split(maxsplit=1)
-                if len(parts) == 2:
-                    status_char, filename = parts
-                    status_color = {
-                        "M": "yellow",
-                        "A": "green",
-                        "D": "red",
-                        "R": "cyan",  # Renamed
-                        "C": "cyan",  # Copied
-                    }.get(status_char[0], "white")
-                    status_name = {
-                        "M": "Modified",
-                        "A": "Added",
-                        "D": "Deleted",
-                        "R": "Renamed",
-                        "C": "Copied",
-                    }.get(status_char[0], "Changed")
-                    console.print(
-                        f"  [{status_color}]{status_char}[/{status_color}]  {filename} ({status_name})"
-                    )
+                status_char, sep, filename = line.partition("\t")
+                if not sep:
+                    continue
+                status_color, status_name = lookup(status_char[:1], _DIFF_STATUS_DEFAULT)
+                lines.append(
+                    f"  [{status_color}]{status_char}[/{status_color}]  {filename} ({status_name})"
+                )
+            if lines:
+                console.print("\n".join(lines), highlight=False)
         else:
             console.print("  [dim]No differences found[/dim]")
     elif summary:
@@ -523,15 +657,10 @@ def diff_worktrees(branch1: str, branch2: str, summary: bool = False, files: boo
         else:
             console.print("  [dim]No differences found[/dim]")
     else:
-        # Show full diff
-        result = git_command(
-            "diff",
-            branch1,
-            branch2,
-            repo=repo,
-            capture=True,
-        )
-        if result.stdout.strip():
-            console.print(result.stdout)
-        else:
+        # Show full diff, streamed so large diffs are never buffered in memory
+        has_output = False
+        for line in git_stream_lines("diff", branch1, branch2, repo=repo):
+            console.out(line, end="", highlight=False)
+            has_output = True
+        if not has_output:
             console.print("[dim]No differences found[/dim]\n")
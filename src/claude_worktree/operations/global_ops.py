@@ -3,6 +3,11 @@
 Business logic for cross-repository worktree commands (`cw -g`).
 """
 
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
 from ..console import get_console
@@ -15,12 +20,15 @@ from ..registry import (
     scan_for_repos,
 )
 from .display import (
+    _HOUR_NS,
     _MIN_TABLE_WIDTH,
     STATUS_COLORS,
+    _format_age_hours,
     _get_terminal_width,
-    format_age,
+    _relative_path,
     get_worktree_status,
 )
+from .helpers import _REPO_WORKERS
 
 console = get_console()
 
@@ -44,63 +52,28 @@ def global_list_worktrees() -> None:
 
     console.print("\n[bold cyan]Global Worktree Overview[/bold cyan]\n")
 
-    import os
-    import time
+    # Probe repositories concurrently; each one is dominated by git subprocesses
+    cwd = Path.cwd()
+    sorted_repos = sorted(repos, key=itemgetter(0))
+    with ThreadPoolExecutor(max_workers=min(_REPO_WORKERS, len(sorted_repos))) as executor:
+        results = list(
+            executor.map(
+                lambda repo: _collect_repo_rows(repo[0], repo[1], cwd),
+                sorted_repos,
+            )
+        )
 
     total_repos = 0
-    status_counts: dict[str, int] = {}
     # Collect all rows: (repo_name, worktree_id, current_branch, status, age_str, rel_path)
     rows: list[tuple[str, str, str, str, str, str]] = []
-
-    for name, repo_path in sorted(repos, key=lambda x: x[0]):
-        if not repo_path.exists():
-            console.print(
-                f"[yellow]⚠ {name}[/yellow] [dim]({repo_path})[/dim] — "
-                "[red]repository not found[/red]"
-            )
-            continue
-
-        try:
-            feature_wts = get_feature_worktrees(repo_path)
-        except Exception:
-            console.print(
-                f"[yellow]⚠ {name}[/yellow] [dim]({repo_path})[/dim] — "
-                "[red]failed to read worktrees[/red]"
-            )
+    for repo_rows, warning in results:
+        if warning:
+            console.print(warning)
             continue
 
-        has_feature = False
-        for branch_name, path in feature_wts:
-            status = get_worktree_status(str(path), repo_path)
-
-            # Check intended branch for mismatch detection
-            intended = get_config(
-                CONFIG_KEY_INTENDED_BRANCH.format(branch_name), repo_path
-            )
-            worktree_id = intended if intended else branch_name
-
-            # Compute age
-            age_str = ""
-            try:
-                if path.exists():
-                    mtime = path.stat().st_mtime
-                    age_days = (time.time() - mtime) / (24 * 3600)
-                    age_str = format_age(age_days)
-            except OSError:
-                pass
-
-            # Relative path
-            try:
-                rel_path = os.path.relpath(str(path), repo_path)
-            except ValueError:
-                rel_path = str(path)
-
-            rows.append((name, worktree_id, branch_name, status, age_str, rel_path))
-            status_counts[status] = status_counts.get(status, 0) + 1
-            has_feature = True
-
-        if has_feature:
+        if repo_rows:
             total_repos += 1
+        rows.extend(repo_rows)
 
     if not rows:
         console.print(
@@ -118,9 +91,10 @@ def global_list_worktrees() -> None:
 
     # Summary footer
     total_worktrees = len(rows)
+    status_counts = Counter(map(itemgetter(3), rows))
     summary_parts: list[str] = []
     for status_name in ("clean", "modified", "active", "stale"):
-        count = status_counts.get(status_name, 0)
+        count = status_counts[status_name]
         if count > 0:
             color = STATUS_COLORS.get(status_name, "white")
             summary_parts.append(f"[{color}]{count} {status_name}[/{color}]")
@@ -132,6 +106,68 @@ def global_list_worktrees() -> None:
     console.print()
 
 
+def _collect_repo_rows(
+    name: str, repo_path: Path, cwd: Path
+) -> tuple[list[tuple[str, str, str, str, str, str]], str | None]:
+    """Collect display rows for one registered repository.
+
+    Runs on a worker thread, so it only gathers data and never prints.
+
+    Args:
+        name: Repository display name
+        repo_path: Path to the repository
+        cwd: Current working directory, for active-worktree detection
+
+    Returns:
+        Tuple of (rows, warning). warning is a message to print instead of
+        rows when the repository could not be read.
+    """
+    if not repo_path.exists():
+        return [], (
+            f"[yellow]⚠ {name}[/yellow] [dim]({repo_path})[/dim] — "
+            "[red]repository not found[/red]"
+        )
+
+    try:
+        feature_wts = get_feature_worktrees(repo_path)
+    except Exception:
+        return [], (
+            f"[yellow]⚠ {name}[/yellow] [dim]({repo_path})[/dim] — "
+            "[red]failed to read worktrees[/red]"
+        )
+
+    rows: list[tuple[str, str, str, str, str, str]] = []
+    now_ns = time.time_ns()
+    for branch_name, path in feature_wts:
+        status = get_worktree_status(str(path), repo_path, cwd)
+
+        # Check intended branch for mismatch detection
+        intended = get_config(CONFIG_KEY_INTENDED_BRANCH.format(branch_name), repo_path)
+        worktree_id = intended if intended else branch_name
+
+        # Compute age from a single stat (missing directories have no age)
+        age_str = ""
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        if st is not None:
+            age_str = _format_age_hours((now_ns - st.st_mtime_ns) // _HOUR_NS)
+
+        rel_path = _relative_path(path, repo_path)
+
+        rows.append((name, worktree_id, branch_name, status, age_str, rel_path))
+
+    return rows, None
+
+
+def _resolve_status_colors(
+    rows: list[tuple[str, str, str, str, str, str]],
+) -> dict[str, str]:
+    """Map each status present in rows to its display color."""
+    return {status: STATUS_COLORS.get(status, "white") for status in {row[3] for row in rows}}
+
+
 def _global_print_table(
     rows: list[tuple[str, str, str, str, str, str]],
 ) -> None:
@@ -143,50 +179,55 @@ def _global_print_table(
     wt_col = min(max(max_wt_len + 2, 20), 35)
     br_col = min(max(max_br_len + 2, 20), 35)
 
-    console.print(
+    out = [
         f"{'REPO':<{repo_col}} {'WORKTREE':<{wt_col}} {'CURRENT BRANCH':<{br_col}} "
-        f"{'STATUS':<10} {'AGE':<12} PATH"
-    )
-    console.print("─" * (repo_col + wt_col + br_col + 82))
+        f"{'STATUS':<10} {'AGE':<12} PATH",
+        "─" * (repo_col + wt_col + br_col + 82),
+    ]
 
+    colors = _resolve_status_colors(rows)
     for repo_name, worktree_id, current_branch, status, age_str, rel_path in rows:
-        color = STATUS_COLORS.get(status, "white")
+        color = colors[status]
 
         if worktree_id != current_branch:
             branch_display = f"[yellow]{current_branch} (⚠️)[/yellow]"
         else:
             branch_display = current_branch
 
-        console.print(
+        out.append(
             f"{repo_name:<{repo_col}} {worktree_id:<{wt_col}} {branch_display:<{br_col}} "
             f"[{color}]{status:<10}[/{color}] {age_str:<12} {rel_path}"
         )
 
+    console.print("\n".join(out), highlight=False)
+
 
 def _global_print_compact(
     rows: list[tuple[str, str, str, str, str, str]],
 ) -> None:
     """Print global worktree rows in compact format for narrow terminals."""
+    out: list[str] = []
     current_repo = ""
+    colors = _resolve_status_colors(rows)
     for repo_name, worktree_id, current_branch, status, age_str, rel_path in rows:
         if repo_name != current_repo:
             if current_repo:
-                console.print()  # blank line between repos
-            console.print(f"[bold]{repo_name}[/bold]")
+                out.append("")  # blank line between repos
+            out.append(f"[bold]{repo_name}[/bold]")
             current_repo = repo_name
 
-        color = STATUS_COLORS.get(status, "white")
+        color = colors[status]
         age_part = f"  {age_str}" if age_str else ""
 
-        console.print(
-            f"  [bold]{worktree_id}[/bold]  [{color}]{status}[/{color}]{age_part}"
-        )
+        out.append(f"  [bold]{worktree_id}[/bold]  [{color}]{status}[/{color}]{age_part}")
 
         details: list[str] = []
         if worktree_id != current_branch:
             details.append(f"branch: [yellow]{current_branch} (⚠️)[/yellow]")
         details.append(f"path: {rel_path}")
-        console.print(f"    {' · '.join(details)}")
+        out.append(f"    {' · '.join(details)}")
+
+    console.print("\n".join(out), highlight=False)
 
 
 def global_scan(base_dir: Path | None = None) -> None:
@@ -1,24 +1,57 @@
 """Helper functions shared across operations modules."""
 
-from contextvars import ContextVar
+import os
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
+from typing import TypeVar
+
+from rich.text import Text
 
 from ..console import get_console
 from ..constants import CONFIG_KEY_BASE_BRANCH, CONFIG_KEY_BASE_PATH
 from ..exceptions import GitError, InvalidBranchError, WorktreeNotFoundError
 from ..git_utils import (
+    find_worktree_by_branch_or_name,
     find_worktree_by_intended_branch,
     find_worktree_by_name,
+    first_existing_branch,
     get_config,
     get_current_branch,
     get_main_repo_root,
     get_repo_root,
     is_non_interactive,
-    parse_worktrees,
+    parse_worktree_branches,
+    worktree_path_index,
 )
+from ..registry import get_all_registered_repos
+
+_A = TypeVar("_A")
+_R = TypeVar("_R")
+
+# Default branch names tried, in order, when inferring a missing base branch
+_COMMON_BASE_BRANCHES = tuple(sys.intern(b) for b in ("main", "master", "develop"))
 
-# ContextVar for global mode (-g flag)
-_global_mode: ContextVar[bool] = ContextVar("_global_mode", default=False)
+# Upper bound on concurrent per-repo probes in global mode (target
+# resolution here and global list in global_ops)
+_REPO_WORKERS = 32
+
+# Registered repo paths seen as directories, with monotonic check time
+_EXISTENCE_TTL = 60.0
+_existence_cache: dict[str, float] = {}
+
+# Static prompt lines, parsed from markup once instead of on every print
+_BAD_CHOICE_12 = Text.from_markup("[red]Please enter 1 or 2[/red]")
+_BAD_CHOICE_RANGE_TMPL = "Please enter a number between 1 and {}"
+_REPO_BRANCH_TIP = Text.from_markup(
+    "[dim]Tip: Use 'repo:branch' notation to specify directly.[/dim]"
+)
+
+# Global mode flag (-g), set once per CLI invocation
+_global_mode: bool = False
 
 
 def parse_repo_branch_target(target: str) -> tuple[str | None, str]:
@@ -32,21 +65,21 @@ def parse_repo_branch_target(target: str) -> tuple[str | None, str]:
     Returns:
         (repo_name, branch) if target contains ':', otherwise (None, target).
     """
-    if ":" in target:
-        repo_name, _, branch = target.partition(":")
-        if repo_name and branch:
-            return repo_name, branch
+    repo_name, sep, branch = target.partition(":")
+    if sep and repo_name and branch:
+        return repo_name, branch
     return None, target
 
 
 def set_global_mode(enabled: bool) -> None:
-    """Set the global mode flag via ContextVar."""
-    _global_mode.set(enabled)
+    """Set the global mode flag."""
+    global _global_mode
+    _global_mode = enabled
 
 
 def is_global_mode() -> bool:
     """Check if global mode is currently active."""
-    return _global_mode.get()
+    return _global_mode
 
 
 def _prompt_worktree_disambiguation(
@@ -68,8 +101,8 @@ def _prompt_worktree_disambiguation(
     """
     console = get_console()
     console.print(f"\n[yellow]Multiple matches found for '{target}':[/yellow]")
-    console.print(f"  [1] Branch '{target}' → {branch_path}")
-    console.print(f"  [2] Worktree '{worktree_path.name}' → {worktree_path}")
+    console.print(f"  [1] Branch '{target}' → {branch_path}", highlight=False)
+    console.print(f"  [2] Worktree '{worktree_path.name}' → {worktree_path}", highlight=False)
     console.print()
 
     prompt = f"Which one do you want to {action}? [1/2]: " if action else "Which one? [1/2]: "
@@ -79,7 +112,17 @@ def _prompt_worktree_disambiguation(
             return "branch"
         elif choice == "2":
             return "worktree"
-        console.print("[red]Please enter 1 or 2[/red]")
+        console.print(_BAD_CHOICE_12)
+
+
+def _same_path(a: Path, b: Path) -> bool:
+    """Compare two paths by their resolved form.
+
+    Unlike samefile() this doesn't stat both targets, and it works for paths
+    that no longer exist. The same directory mounted under two names would
+    compare unequal, which doesn't happen in practical worktree layouts.
+    """
+    return a == b or os.path.realpath(a) == os.path.realpath(b)
 
 
 def _get_branch_for_worktree(repo: Path, worktree_path: Path) -> str | None:
@@ -92,18 +135,33 @@ def _get_branch_for_worktree(repo: Path, worktree_path: Path) -> str | None:
     Returns:
         Branch name (without refs/heads/ prefix) or None if detached
     """
-    for branch, path in parse_worktrees(repo):
-        try:
-            if path.samefile(worktree_path):
-                if branch.startswith("refs/heads/"):
-                    return branch[11:]
-                return branch if branch != "(detached)" else None
-        except (OSError, ValueError):
-            if path.resolve() == worktree_path.resolve():
-                if branch.startswith("refs/heads/"):
-                    return branch[11:]
-                return branch if branch != "(detached)" else None
-    return None
+    return worktree_path_index(repo).get(os.path.realpath(worktree_path))
+
+
+def _build_target_index(main_repo: Path) -> dict[str, Path | None]:
+    """Map checked-out branch names to worktrees for resolve_worktree_target.
+
+    A branch whose name is also the directory name of a different worktree
+    maps to None, since that target needs the full lookup and disambiguation.
+
+    Args:
+        main_repo: Main repository path
+
+    Returns:
+        Dict of simple branch name -> worktree path (or None if ambiguous)
+    """
+    worktrees = parse_worktree_branches(main_repo)
+    by_name: dict[str, Path] = {}
+    for _, path in worktrees:
+        by_name.setdefault(path.name, path)
+
+    index: dict[str, Path | None] = {}
+    for name, path in worktrees:
+        if name is None:
+            continue
+        other = by_name.get(name)
+        index.setdefault(name, path if other is None or other == path else None)
+    return index
 
 
 def _resolve_dual_match(
@@ -127,12 +185,7 @@ def _resolve_dual_match(
         WorktreeNotFoundError: If no match found or ambiguous in non-interactive mode
     """
     if branch_match and worktree_match:
-        try:
-            same_worktree = branch_match.samefile(worktree_match)
-        except (OSError, ValueError):
-            same_worktree = branch_match.resolve() == worktree_match.resolve()
-
-        if same_worktree:
+        if _same_path(branch_match, worktree_match):
             return branch_match, target
         else:
             if is_non_interactive():
@@ -173,59 +226,108 @@ def _resolve_global_target(
         lookup_mode: "branch", "worktree", or None (try both).
 
     Returns:
-        List of (worktree_path, branch_name, main_repo) tuples for all matches.
+        List of (worktree_path, branch_name, main_repo) tuples for all matches,
+        ordered by repository name, with at most one entry per worktree path.
     """
-    from ..registry import get_all_registered_repos
-
     repo_name, branch_target = parse_repo_branch_target(target)
-    matches: list[tuple[Path, str, Path]] = []
+    repos = sorted(
+        (
+            (name, repo_path)
+            for name, repo_path in get_all_registered_repos()
+            if repo_name is None or name == repo_name
+        ),
+        key=itemgetter(0),
+    )
+    if not repos:
+        return []
+
+    # Probes are subprocess-bound; map() keeps results in repo-name order
+    with ThreadPoolExecutor(max_workers=min(_REPO_WORKERS, len(repos))) as executor:
+        results = executor.map(lambda repo: _probe_repo(repo[1], branch_target, lookup_mode), repos)
+
+        # The same worktree can surface through more than one registered repo
+        # (e.g. symlinked clones); keep only its first match
+        matches: list[tuple[Path, str, Path]] = []
+        seen: set[str] = set()
+        for repo_matches in results:
+            for match in repo_matches:
+                key = os.path.realpath(match[0])
+                if key not in seen:
+                    seen.add(key)
+                    matches.append(match)
+        return matches
+
+
+def _repo_dir_exists(repo_path: Path) -> bool:
+    """Check that a registered repo directory exists, caching hits briefly.
+
+    Only positive results are cached: a repo removed within the TTL just
+    fails its lookup and is skipped, while a missing repo is re-checked.
+    """
+    key = str(repo_path)
+    now = time.monotonic()
+    checked = _existence_cache.get(key)
+    if checked is not None and now - checked < _EXISTENCE_TTL:
+        return True
+    if os.path.isdir(key):
+        _existence_cache[key] = now
+        return True
+    _existence_cache.pop(key, None)
+    return False
+
+
+def _probe_repo(
+    repo_path: Path,
+    branch_target: str,
+    lookup_mode: str | None,
+) -> list[tuple[Path, str, Path]]:
+    """Find worktrees matching branch_target in one registered repository.
 
-    for name, repo_path in get_all_registered_repos():
-        if repo_name is not None and name != repo_name:
-            continue
-        if not repo_path.exists():
-            continue
+    Args:
+        repo_path: Registered repository path.
+        branch_target: Branch name or worktree directory name.
+        lookup_mode: "branch", "worktree", or None (try both).
 
-        try:
-            branch_match: Path | None = None
-            worktree_match: Path | None = None
+    Returns:
+        List of (worktree_path, branch_name, main_repo) tuples; empty if the
+        repo is missing. Lookups that error count as no match.
+    """
+    if not _repo_dir_exists(repo_path):
+        return []
 
-            if lookup_mode == "branch":
-                branch_match = find_worktree_by_intended_branch(repo_path, branch_target)
-            elif lookup_mode == "worktree":
-                worktree_match = find_worktree_by_name(repo_path, branch_target)
-            else:
-                branch_match = find_worktree_by_intended_branch(repo_path, branch_target)
-                worktree_match = find_worktree_by_name(repo_path, branch_target)
-
-            if branch_match and worktree_match:
-                try:
-                    same = branch_match.samefile(worktree_match)
-                except (OSError, ValueError):
-                    same = branch_match.resolve() == worktree_match.resolve()
-                if same:
-                    matches.append((branch_match, branch_target, repo_path))
-                else:
-                    # Both match different worktrees in same repo — add both
-                    matches.append((branch_match, branch_target, repo_path))
-                    wt_branch = _get_branch_for_worktree(repo_path, worktree_match)
-                    matches.append(
-                        (worktree_match, wt_branch or branch_target, repo_path)
-                    )
-            elif branch_match:
-                matches.append((branch_match, branch_target, repo_path))
-            elif worktree_match:
-                wt_branch = _get_branch_for_worktree(repo_path, worktree_match)
-                matches.append(
-                    (worktree_match, wt_branch or branch_target, repo_path)
-                )
-        except Exception:
-            # Skip repos that error during lookup
-            continue
+    branch_match: Path | None = None
+    worktree_match: Path | None = None
+    if lookup_mode == "branch":
+        branch_match = _quiet_lookup(find_worktree_by_intended_branch, repo_path, branch_target)
+    elif lookup_mode == "worktree":
+        worktree_match = _quiet_lookup(find_worktree_by_name, repo_path, branch_target)
+    else:
+        both = _quiet_lookup(find_worktree_by_branch_or_name, repo_path, branch_target)
+        if both is not None:
+            branch_match, worktree_match = both
 
+    matches: list[tuple[Path, str, Path]] = []
+    if branch_match:
+        matches.append((branch_match, branch_target, repo_path))
+    if worktree_match and not (branch_match and _same_path(branch_match, worktree_match)):
+        # Both may match different worktrees in the same repo — add both
+        wt_branch = _quiet_lookup(_get_branch_for_worktree, repo_path, worktree_match)
+        matches.append((worktree_match, wt_branch or branch_target, repo_path))
     return matches
 
 
+def _quiet_lookup(lookup: Callable[[Path, _A], _R], repo_path: Path, arg: _A) -> _R | None:
+    """Run a per-repo lookup, treating any error as no match.
+
+    Keeps the exception handler scoped to the fallible git call so the
+    global search skips broken repos without wrapping the whole probe.
+    """
+    try:
+        return lookup(repo_path, arg)
+    except Exception:
+        return None
+
+
 def _disambiguate_global_matches(
     target: str,
     matches: list[tuple[Path, str, Path]],
@@ -255,19 +357,20 @@ def _disambiguate_global_matches(
     console = get_console()
     console.print(f"\n[yellow]Multiple matches found for '{target}':[/yellow]")
     for i, (wt_path, branch, repo) in enumerate(matches, 1):
-        console.print(f"  [{i}] {repo.name}:{branch} → {wt_path}")
-    console.print("[dim]Tip: Use 'repo:branch' notation to specify directly.[/dim]")
+        console.print(f"  [{i}] {repo.name}:{branch} → {wt_path}", highlight=False)
+    console.print(_REPO_BRANCH_TIP)
     console.print()
 
+    prompt = f"Which one? [1-{len(matches)}]: "
+    bad_choice = Text(_BAD_CHOICE_RANGE_TMPL.format(len(matches)), style="red")
     while True:
-        choice = console.input(f"Which one? [1-{len(matches)}]: ").strip()
-        try:
+        choice = console.input(prompt).strip()
+        # isdecimal() admits exactly the strings int() parses without a sign
+        if choice.isdecimal():
             idx = int(choice) - 1
             if 0 <= idx < len(matches):
                 return matches[idx]
-        except ValueError:
-            pass
-        console.print(f"[red]Please enter a number between 1 and {len(matches)}[/red]")
+        console.print(bad_choice)
 
 
 def resolve_worktree_target(
@@ -297,7 +400,8 @@ def resolve_worktree_target(
         InvalidBranchError: If current branch cannot be determined
         GitError: If not in a git repository
     """
-    if target is None and is_global_mode():
+    global_mode = is_global_mode()
+    if target is None and global_mode:
         raise WorktreeNotFoundError(
             "Global mode requires an explicit target (branch or worktree name)."
         )
@@ -313,7 +417,7 @@ def resolve_worktree_target(
         return worktree_path, branch_name, worktree_repo
 
     # Global mode: search all registered repositories
-    if is_global_mode():
+    if global_mode:
         matches = _resolve_global_target(target, lookup_mode)
         if not matches:
             raise WorktreeNotFoundError(
@@ -327,6 +431,13 @@ def resolve_worktree_target(
     # Get main repo for lookups
     main_repo = get_main_repo_root()
 
+    # Fast path: target is a checked-out branch that no other worktree's
+    # directory name shadows, so the config-backed lookups can't disagree
+    if lookup_mode != "worktree":
+        hit = _build_target_index(main_repo).get(target)
+        if hit is not None:
+            return hit, target, get_repo_root(hit)
+
     # Dual lookup based on mode
     branch_match: Path | None = None
     worktree_match: Path | None = None
@@ -341,8 +452,7 @@ def resolve_worktree_target(
             raise WorktreeNotFoundError(f"No worktree found with name '{target}'")
     else:
         # Try both
-        branch_match = find_worktree_by_intended_branch(main_repo, target)
-        worktree_match = find_worktree_by_name(main_repo, target)
+        branch_match, worktree_match = find_worktree_by_branch_or_name(main_repo, target)
 
     # Resolve with disambiguation if needed
     worktree_path, branch_name = _resolve_dual_match(
@@ -353,6 +463,25 @@ def resolve_worktree_target(
     return worktree_path, branch_name, worktree_repo
 
 
+def _get_worktree_config_pair(branch: str, repo: Path) -> tuple[str | None, str | None]:
+    """Read a branch's base-branch and base-path metadata together.
+
+    Both keys come from git_utils' per-repo config snapshot, so the pair
+    costs at most one `git config` call and none when the config is unchanged.
+
+    Args:
+        branch: Feature branch name
+        repo: Repository path
+
+    Returns:
+        (base_branch, base_path) as stored, each None if unset
+    """
+    return (
+        get_config(CONFIG_KEY_BASE_BRANCH.format(branch), repo),
+        get_config(CONFIG_KEY_BASE_PATH.format(branch), repo),
+    )
+
+
 def get_worktree_metadata(branch: str, repo: Path) -> tuple[str, Path]:
     """
     Get worktree metadata (base branch and base repository path).
@@ -381,11 +510,7 @@ def get_worktree_metadata(branch: str, repo: Path) -> tuple[str, Path]:
         >>> print(f"Created from: {base_branch}")
         Created from: main
     """
-    from ..console import get_console
-    from ..git_utils import branch_exists, parse_worktrees
-
-    base_branch = get_config(CONFIG_KEY_BASE_BRANCH.format(branch), repo)
-    base_path_str = get_config(CONFIG_KEY_BASE_PATH.format(branch), repo)
+    base_branch, base_path_str = _get_worktree_config_pair(branch, repo)
 
     # If metadata exists, use it
     if base_branch and base_path_str:
@@ -401,7 +526,7 @@ def get_worktree_metadata(branch: str, repo: Path) -> tuple[str, Path]:
     # Find the main repository by getting the first worktree (which is always the main repo)
     inferred_base_path: Path | None = None
     try:
-        worktrees = parse_worktrees(repo)
+        worktrees = parse_worktree_branches(repo)
         if worktrees:
             # The first worktree is always the main repository
             inferred_base_path = worktrees[0][1]
@@ -416,20 +541,12 @@ def get_worktree_metadata(branch: str, repo: Path) -> tuple[str, Path]:
 
     # Step 2: Infer base_branch
     # Try common default branch names in order: main, master, develop
-    inferred_base_branch: str | None = None
-    for candidate in ["main", "master", "develop"]:
-        if branch_exists(candidate, inferred_base_path):
-            inferred_base_branch = candidate
-            break
+    inferred_base_branch = first_existing_branch(_COMMON_BASE_BRANCHES, inferred_base_path)
 
     # If no common branch found, use the branch of the first worktree (main repo)
     if not inferred_base_branch:
-        if worktrees and worktrees[0][0] != "(detached)":
-            first_branch = worktrees[0][0]
-            # Normalize branch name (remove refs/heads/ prefix)
-            inferred_base_branch = (
-                first_branch[11:] if first_branch.startswith("refs/heads/") else first_branch
-            )
+        if worktrees:
+            inferred_base_branch = worktrees[0][0]
 
     if not inferred_base_branch:
         raise GitError(
@@ -22,6 +22,7 @@ from ..exceptions import (
 from ..git_utils import (
     branch_exists,
     find_worktree_by_branch,
+    find_worktree_by_branch_or_name,
     find_worktree_by_intended_branch,
     find_worktree_by_name,
     get_config,
@@ -710,8 +711,7 @@ def delete_worktree(
                     raise WorktreeNotFoundError(f"No worktree found with name '{target}'")
             else:
                 # Try both
-                branch_match = find_worktree_by_intended_branch(main_repo, target)
-                worktree_match = find_worktree_by_name(main_repo, target)
+                branch_match, worktree_match = find_worktree_by_branch_or_name(main_repo, target)
 
             # 3. Resolve the match
             if branch_match and worktree_match:
@@ -753,8 +753,8 @@ def delete_worktree(
                 )
 
             # Normalize branch_name to simple name without refs/heads/
-            if branch_name and branch_name.startswith("refs/heads/"):
-                branch_name = branch_name[11:]
+            if branch_name:
+                branch_name = normalize_branch_name(branch_name)
 
     # Get main repo path from metadata if available (may be more reliable)
     if branch_name:
@@ -942,7 +942,7 @@ def sync_worktree(
                 continue
 
             # Normalize branch name
-            branch_name = branch[11:] if branch.startswith("refs/heads/") else branch
+            branch_name = normalize_branch_name(branch)
             worktrees_to_sync.append((branch_name, path))
 
         # Sort by dependency order (topological sort)
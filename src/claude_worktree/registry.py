@@ -6,14 +6,49 @@ globally with `cw -g` commands. Registry is stored at
 """
 
 import json
-from datetime import UTC, datetime
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
 from .git_utils import git_command
 
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        # Annotated rather than cast: the cast is redundant once orjson's
+        # stubs are installed, and bytes() would copy the payload
+        data: bytes = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return data
+
+except ImportError:  # orjson is optional (the "fast" extra); both paths write identical files
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+
 REGISTRY_VERSION = 1
 
+# last_seen updates closer together than this don't rewrite the registry
+LAST_SEEN_RESOLUTION = timedelta(minutes=5)
+
+# Parsed registry keyed by file path and stamped with the file's
+# (inode, mtime_ns, size), so writes by other processes are picked up
+_registry_cache: dict[str, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+
+# Upper bound on concurrent repository probes during a scan
+_SCAN_WORKERS = 32
+
 # Directories to skip during filesystem scan
 SCAN_SKIP_DIRS = frozenset({
     "node_modules",
@@ -62,32 +97,62 @@ def get_registry_path() -> Path:
     return config_dir / "registry.json"
 
 
+def _copy_registry(registry: dict[str, Any]) -> dict[str, Any]:
+    """Copy a registry deep enough that callers can mutate repo entries."""
+    data = dict(registry)
+    data.setdefault("version", REGISTRY_VERSION)
+    data["repositories"] = {
+        key: dict(info) for key, info in registry.get("repositories", {}).items()
+    }
+    return data
+
+
+def _stamp(st: os.stat_result) -> tuple[int, int, int]:
+    """Return the cache stamp for a registry file's stat result."""
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
 def load_registry() -> dict[str, Any]:
     """Load the global registry from disk.
 
+    The parsed registry is cached per path and reused while the file's
+    (inode, mtime_ns, size) is unchanged; callers always get their own copy.
+    Every save swaps in a new inode, so the inode alone catches rewrites
+    that keep the size and land within one mtime tick.
+
     Returns:
         Registry dictionary with 'version' and 'repositories' keys.
         Returns empty registry if file doesn't exist.
     """
     registry_path = get_registry_path()
+    key = str(registry_path)
 
-    if not registry_path.exists():
+    try:
+        st = os.stat(registry_path)
+    except OSError:
+        _registry_cache.pop(key, None)
         return {"version": REGISTRY_VERSION, "repositories": {}}
 
+    stamp = _stamp(st)
+    cached = _registry_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return _copy_registry(cached[1])
+
     try:
-        with open(registry_path) as f:
-            data: dict[str, Any] = json.load(f)
+        data: dict[str, Any] = _loads(registry_path.read_bytes())
 
         # Ensure required keys exist
         if "version" not in data:
             data["version"] = REGISTRY_VERSION
         if "repositories" not in data:
             data["repositories"] = {}
-
-        return data
     except (OSError, json.JSONDecodeError):
+        _registry_cache.pop(key, None)
         return {"version": REGISTRY_VERSION, "repositories": {}}
 
+    _registry_cache[key] = (stamp, data)
+    return _copy_registry(data)
+
 
 def save_registry(registry: dict[str, Any]) -> None:
     """Save the global registry to disk.
@@ -98,8 +163,40 @@ def save_registry(registry: dict[str, Any]) -> None:
     registry_path = get_registry_path()
     registry_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(registry_path, "w") as f:
-        json.dump(registry, f, indent=2)
+    # Write a uniquely named sibling temp file and swap it in, so a crash
+    # mid-write never leaves a truncated registry behind and concurrent
+    # saves never share a temp file
+    fd, tmp_name = tempfile.mkstemp(
+        dir=registry_path.parent, prefix=f"{registry_path.name}.", suffix=".tmp"
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb", buffering=65536) as f:
+            f.write(_dumps(registry))
+            f.flush()
+            os.fsync(f.fileno())
+            # Stamp the file we wrote: rename keeps its inode and mtime, and
+            # a stat after the rename could see another process's file
+            stamp = _stamp(os.fstat(f.fileno()))
+        os.replace(tmp_path, registry_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    _registry_cache[str(registry_path)] = (stamp, _copy_registry(registry))
+
+
+def _repo_key(repo_path: Path) -> str:
+    """Return the registry key for a repository path.
+
+    Callers pass canonical roots (from `git rev-parse --show-toplevel` or a
+    resolved scan), so abspath is enough; only a symlinked root needs the
+    full realpath walk.
+    """
+    key = os.path.abspath(repo_path)
+    if os.path.islink(key):
+        return os.path.realpath(key)
+    return key
 
 
 def register_repo(repo_path: Path) -> None:
@@ -111,7 +208,7 @@ def register_repo(repo_path: Path) -> None:
         repo_path: Absolute path to the repository root.
     """
     registry = load_registry()
-    repo_key = str(repo_path.resolve())
+    repo_key = _repo_key(repo_path)
     now = datetime.now(UTC).isoformat()
 
     if repo_key in registry["repositories"]:
@@ -129,19 +226,28 @@ def register_repo(repo_path: Path) -> None:
 def update_last_seen(repo_path: Path) -> None:
     """Update the last_seen timestamp for a registered repository.
 
-    No-op if the repository is not registered.
+    No-op if the repository is not registered, or if its timestamp is
+    already within LAST_SEEN_RESOLUTION, so quick successive runs don't
+    rewrite the registry.
 
     Args:
         repo_path: Absolute path to the repository root.
     """
     registry = load_registry()
-    repo_key = str(repo_path.resolve())
+    repo_key = _repo_key(repo_path)
+    info = registry["repositories"].get(repo_key)
+    if info is None:
+        return
 
-    if repo_key in registry["repositories"]:
-        registry["repositories"][repo_key]["last_seen"] = (
-            datetime.now(UTC).isoformat()
-        )
-        save_registry(registry)
+    now = datetime.now(UTC)
+    try:
+        if now - datetime.fromisoformat(info["last_seen"]) < LAST_SEEN_RESOLUTION:
+            return
+    except (KeyError, TypeError, ValueError):
+        pass  # Missing or malformed timestamp: overwrite it
+
+    info["last_seen"] = now.isoformat()
+    save_registry(registry)
 
 
 def prune_registry() -> list[str]:
@@ -154,9 +260,8 @@ def prune_registry() -> list[str]:
     removed: list[str] = []
 
     for repo_path in list(registry["repositories"]):
-        path = Path(repo_path)
-        # Check if directory exists and is still a git repo
-        if not path.exists() or not (path / ".git").exists():
+        # One stat covers both "directory is gone" and "no longer a git repo"
+        if not os.path.exists(os.path.join(repo_path, ".git")):
             del registry["repositories"][repo_path]
             removed.append(repo_path)
 
@@ -166,7 +271,7 @@ def prune_registry() -> list[str]:
     return removed
 
 
-def _is_git_repo(path: Path) -> bool:
+def _is_git_repo(path: str | Path) -> bool:
     """Check if a path is a git repository root (not a worktree).
 
     Args:
@@ -175,14 +280,34 @@ def _is_git_repo(path: Path) -> bool:
     Returns:
         True if path is a main git repository root.
     """
-    git_path = path / ".git"
     # Main repo has .git as a directory; worktrees have .git as a file
-    return git_path.is_dir()
+    return os.path.isdir(os.path.join(path, ".git"))
 
 
 def _has_worktrees(repo_path: Path) -> bool:
     """Check if a git repository has any worktrees beyond the main one.
 
+    Reads the linked-worktree admin entries under .git/worktrees directly;
+    falls back to asking git only if that directory can't be read.
+
+    Args:
+        repo_path: Path to git repository.
+
+    Returns:
+        True if repository has additional worktrees.
+    """
+    try:
+        with os.scandir(os.path.join(repo_path, ".git", "worktrees")) as it:
+            return any(entry.is_dir() for entry in it)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    except OSError:
+        return _git_lists_worktrees(repo_path)
+
+
+def _git_lists_worktrees(repo_path: Path) -> bool:
+    """Ask `git worktree list` whether a repository has linked worktrees.
+
     Args:
         repo_path: Path to git repository.
 
@@ -222,32 +347,33 @@ def scan_for_repos(base_dir: Path | None = None, max_depth: int = 5) -> list[Pat
 
     base_dir = base_dir.resolve()
     found_repos: list[Path] = []
-
-    def _scan(current: Path, depth: int) -> None:
-        if depth > max_depth:
-            return
-
-        try:
-            entries = sorted(current.iterdir())
-        except (PermissionError, OSError):
-            return
-
-        for entry in entries:
-            if not entry.is_dir():
-                continue
-
-            # Skip hidden dirs (except .git which we check) and known skip dirs
-            if entry.name.startswith(".") or entry.name in SCAN_SKIP_DIRS:
-                continue
-
-            if _is_git_repo(entry) and _has_worktrees(entry):
-                found_repos.append(entry)
-                # Don't recurse into git repos
-                continue
-
-            _scan(entry, depth + 1)
-
-    _scan(base_dir, 0)
+    if max_depth < 0:
+        return found_repos
+
+    def _probe(child: str) -> bool:
+        # Only main repos (.git directory) pay for the worktree probe
+        return _is_git_repo(child) and _has_worktrees(Path(child))
+
+    base = str(base_dir)
+    base_depth = base.rstrip(os.sep).count(os.sep)
+    # Probes are IO-bound; each directory's children are checked concurrently
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+        for root, dirs, _ in os.walk(base, topdown=True, followlinks=False):
+            depth = 0 if root == base else root.count(os.sep) - base_depth
+            # Prune hidden dirs (including .git) and known skip dirs in place
+            names = [d for d in dirs if not d.startswith(".") and d not in SCAN_SKIP_DIRS]
+            children = [os.path.join(root, name) for name in names]
+            dirs[:] = []
+            hits = executor.map(_probe, children)
+            for name, child, hit in zip(names, children, hits, strict=True):
+                if hit:
+                    # Don't recurse into git repos
+                    found_repos.append(Path(child))
+                elif depth < max_depth:
+                    dirs.append(name)
+
+    # Depth-first order by name, as a sorted recursive walk would report them
+    found_repos.sort(key=attrgetter("parts"))
     return found_repos
 
 
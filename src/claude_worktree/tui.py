@@ -3,8 +3,28 @@
 from __future__ import annotations
 
 import os
+import select
 import sys
 
+# Static escape sequences, encoded once
+_ANSI_SAVE = b"\x1b[s"
+_ANSI_RESTORE = b"\x1b[u"
+_ANSI_CLEAR_LINE = b"\x1b[2K"
+_CLEARED_ROW = _ANSI_CLEAR_LINE + b"\r\n"
+_ANSI_UP_2 = b"\x1b[2A"
+_ANSI_HIDE_CURSOR = b"\x1b[?25l"
+_ANSI_SHOW_CURSOR = b"\x1b[?25h"
+
+# Single-byte keys and the final byte of "ESC [" sequences, as _read_key names them
+_SIMPLE_KEYS = {
+    b"\r": "enter",
+    b"\n": "enter",
+    b"\x03": "ctrl-c",
+    b"q": "q",
+    **{bytes([d]): chr(d) for d in b"123456789"},
+}
+_CSI_KEYS = {b"A": "up", b"B": "down"}
+
 
 def arrow_select(
     items: list[tuple[str, str]],
@@ -50,83 +70,119 @@ def _get_terminal_width() -> int:
         return 80
 
 
-def _write_stderr(s: str) -> None:
+def _write_stderr(data: bytes | bytearray) -> None:
     """Write raw bytes to stderr, bypassing buffered text wrapper."""
-    os.write(sys.stderr.fileno(), s.encode())
+    fd = sys.stderr.fileno()
+    view = memoryview(data)
+    # A whole frame can exceed what one write() accepts; finish short writes
+    while view:
+        view = view[os.write(fd, view) :]
 
 
 def _truncate(text: str, width: int) -> str:
-    """Truncate text to fit within terminal width."""
-    # Strip ANSI escapes to measure visible length
-    import re
-
-    visible = re.sub(r"\x1b\[[^m]*m", "", text)
-    if len(visible) <= width:
-        return text
-    # Truncate: find where to cut by walking both strings
-    vis_pos = 0
+    """Truncate text to fit within terminal width.
+
+    ANSI escape sequences don't count toward the visible length. Measuring
+    and finding the cut point happen in the same walk over the string.
+    """
+    n = len(text)
+    keep = width - 1  # visible chars kept before the reset when truncating
     cut_pos = 0
+    vis_pos = 0
     i = 0
-    while i < len(text) and vis_pos < width - 1:
+    while i < n:
         if text[i] == "\x1b":
             # Skip ANSI sequence
-            j = i + 1
-            while j < len(text) and text[j] != "m":
-                j += 1
-            i = j + 1
-        else:
-            vis_pos += 1
-            i += 1
-        cut_pos = i
-    return text[:cut_pos] + "\x1b[0m"
+            end = text.find("m", i + 1)
+            i = n if end < 0 else end + 1
+            continue
+        vis_pos += 1
+        if vis_pos > width:
+            return text[:cut_pos] + "\x1b[0m"
+        i += 1
+        if vis_pos == keep:
+            cut_pos = i
+    return text
+
+
+def _item_lines(items: list[tuple[str, str]], width: int) -> tuple[list[bytes], list[bytes]]:
+    """Encode every item row once, in its plain and highlighted forms."""
+    plain = [
+        _truncate(f"    {label}  \x1b[2m{value}\x1b[0m", width).encode() for label, value in items
+    ]
+    highlighted = [
+        _truncate(f"  \x1b[1;7m > {label} \x1b[0m  \x1b[2m{value}\x1b[0m", width).encode()
+        for label, value in items
+    ]
+    return plain, highlighted
 
 
 def _render(
-    items: list[tuple[str, str]],
     title: str,
+    lines: tuple[list[bytes], list[bytes]],
     selected: int,
-    total_lines: int,
+    width: int,
     *,
     first_render: bool = False,
 ) -> None:
-    """Render the selector list on stderr using ANSI escape codes."""
-    width = _get_terminal_width()
+    """Render the whole selector list on stderr using ANSI escape codes."""
+    plain, highlighted = lines
 
+    # Build the whole frame and emit it with a single write
+    buf = bytearray()
     if not first_render:
         # Restore cursor to saved position
-        _write_stderr("\x1b[u")
+        buf += _ANSI_RESTORE
 
     # Save cursor position at the start of our render area
-    _write_stderr("\x1b[s")
+    buf += _ANSI_SAVE
 
     # Title
     line = f"  \x1b[1m{title}\x1b[0m"
-    _write_stderr(f"\x1b[2K{_truncate(line, width)}\r\n")
+    buf += _ANSI_CLEAR_LINE
+    buf += f"{_truncate(line, width)}\r\n".encode()
     # Blank line
-    _write_stderr("\x1b[2K\r\n")
+    buf += _CLEARED_ROW
 
-    for i, (label, value) in enumerate(items):
-        _write_stderr("\x1b[2K")  # clear line
-        if i == selected:
-            line = f"  \x1b[1;7m > {label} \x1b[0m  \x1b[2m{value}\x1b[0m"
-        else:
-            line = f"    {label}  \x1b[2m{value}\x1b[0m"
-        _write_stderr(f"{_truncate(line, width)}\r\n")
+    for i, row in enumerate(plain):
+        buf += _ANSI_CLEAR_LINE
+        buf += highlighted[i] if i == selected else row
+        buf += b"\r\n"
 
     # Clear any leftover lines below (in case of previous longer render)
-    for _ in range(2):
-        _write_stderr("\x1b[2K\r\n")
+    buf += _CLEARED_ROW * 2
     # Move back up to just after our items
-    _write_stderr("\x1b[2A")
+    buf += _ANSI_UP_2
+    _write_stderr(buf)
+
+
+def _render_selection(
+    lines: tuple[list[bytes], list[bytes]],
+    old: int,
+    new: int,
+    total_lines: int,
+) -> None:
+    """Redraw only the two rows whose highlight changed.
+
+    Rows are addressed relative to the position saved by _render (title and
+    blank line first), and the cursor is left just after the items again.
+    """
+    plain, highlighted = lines
+    buf = bytearray()
+    for index, row in ((old, plain[old]), (new, highlighted[new])):
+        buf += _ANSI_RESTORE
+        buf += f"\x1b[{index + 2}B\r".encode()
+        buf += _ANSI_CLEAR_LINE
+        buf += row
+    buf += _ANSI_RESTORE
+    buf += f"\x1b[{total_lines}B".encode()
+    _write_stderr(buf)
 
 
 def _cleanup(total_lines: int) -> None:
     """Erase the rendered selector from stderr."""
-    # Restore to saved position
-    _write_stderr("\x1b[u")
-    for _ in range(total_lines + 2):  # +2 for extra cleared lines
-        _write_stderr("\x1b[2K\r\n")
-    _write_stderr("\x1b[u")
+    # Restore to saved position, clear (+2 for extra cleared lines), restore again
+    _write_stderr(_ANSI_RESTORE + _CLEARED_ROW * (total_lines + 2) + _ANSI_RESTORE)
 
 
 def _read_key(fd: int) -> str:
@@ -137,33 +193,15 @@ def _read_key(fd: int) -> str:
 
     if ch == b"\x1b":
         # Could be an escape sequence — peek with a short timeout
-        import select
-
         readable, _, _ = select.select([fd], [], [], 0.05)
         if not readable:
             # Bare Escape key
             return "esc"
-        seq1 = os.read(fd, 1)
-        if seq1 == b"[":
-            seq2 = os.read(fd, 1)
-            if seq2 == b"A":
-                return "up"
-            if seq2 == b"B":
-                return "down"
-            # Consume any remaining bytes of unknown sequence
-            return "unknown"
+        if os.read(fd, 1) == b"[":
+            return _CSI_KEYS.get(os.read(fd, 1), "unknown")
         return "unknown"
 
-    if ch == b"\r" or ch == b"\n":
-        return "enter"
-    if ch == b"\x03":
-        return "ctrl-c"
-    if ch == b"q":
-        return "q"
-    if ch in (b"1", b"2", b"3", b"4", b"5", b"6", b"7", b"8", b"9"):
-        return ch.decode()
-
-    return "unknown"
+    return _SIMPLE_KEYS.get(ch, "unknown")
 
 
 def _arrow_select_unix(
@@ -172,6 +210,7 @@ def _arrow_select_unix(
     default_index: int,
 ) -> str | None:
     """Unix implementation using termios/tty."""
+    import signal
     import termios
     import tty
 
@@ -180,12 +219,33 @@ def _arrow_select_unix(
     selected = default_index
     total_lines = len(items) + 2  # title + blank + items
 
+    # Probe the width once and again only after the terminal is resized
+    resized = False
+    width = _get_terminal_width()
+    lines = _item_lines(items, width)
+
+    def _on_resize(signum: int, frame: object) -> None:
+        nonlocal resized
+        resized = True
+
+    old_winch = signal.signal(signal.SIGWINCH, _on_resize)
+
+    def _redraw(old: int) -> None:
+        nonlocal resized, width, lines
+        if resized:
+            resized = False
+            width = _get_terminal_width()
+            lines = _item_lines(items, width)
+            _render(title, lines, selected, width)
+        else:
+            _render_selection(lines, old, selected, total_lines)
+
     # Hide cursor
-    _write_stderr("\x1b[?25l")
+    _write_stderr(_ANSI_HIDE_CURSOR)
 
     try:
         tty.setraw(fd)
-        _render(items, title, selected, total_lines, first_render=True)
+        _render(title, lines, selected, width, first_render=True)
 
         while True:
             key = _read_key(fd)
@@ -199,11 +259,13 @@ def _arrow_select_unix(
                 return None
 
             if key == "up":
+                old = selected
                 selected = (selected - 1) % len(items)
-                _render(items, title, selected, total_lines)
+                _redraw(old)
             elif key == "down":
+                old = selected
                 selected = (selected + 1) % len(items)
-                _render(items, title, selected, total_lines)
+                _redraw(old)
             elif key in "123456789":
                 idx = int(key) - 1
                 if 0 <= idx < len(items):
@@ -214,9 +276,10 @@ def _arrow_select_unix(
         _cleanup(total_lines)
         return None
     finally:
+        signal.signal(signal.SIGWINCH, old_winch)
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
         # Show cursor
-        _write_stderr("\x1b[?25h")
+        _write_stderr(_ANSI_SHOW_CURSOR)
 
 
 def _arrow_select_windows(
@@ -229,11 +292,13 @@ def _arrow_select_windows(
 
     selected = default_index
     total_lines = len(items) + 2
+    width = _get_terminal_width()  # not refreshed on resize
+    lines = _item_lines(items, width)
 
-    _write_stderr("\x1b[?25l")
+    _write_stderr(_ANSI_HIDE_CURSOR)
 
     try:
-        _render(items, title, selected, total_lines, first_render=True)
+        _render(title, lines, selected, width, first_render=True)
 
         while True:
             ch = msvcrt.getwch()  # type: ignore[attr-defined]
@@ -250,11 +315,13 @@ def _arrow_select_windows(
                 # Special key prefix on Windows
                 key = msvcrt.getwch()  # type: ignore[attr-defined]
                 if key == "H":  # Up arrow
+                    old = selected
                     selected = (selected - 1) % len(items)
-                    _render(items, title, selected, total_lines)
+                    _render_selection(lines, old, selected, total_lines)
                 elif key == "P":  # Down arrow
+                    old = selected
                     selected = (selected + 1) % len(items)
-                    _render(items, title, selected, total_lines)
+                    _render_selection(lines, old, selected, total_lines)
 
             elif ch in "123456789":
                 idx = int(ch) - 1
@@ -266,7 +333,7 @@ def _arrow_select_windows(
         _cleanup(total_lines)
         return None
     finally:
-        _write_stderr("\x1b[?25h")
+        _write_stderr(_ANSI_SHOW_CURSOR)
 
 
 def _arrow_select_fallback(
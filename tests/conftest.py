@@ -1,10 +1,20 @@
 """Shared pytest fixtures for claude-worktree tests."""
 
+import contextlib
+import io
+import os
+import shutil
 import subprocess
 from collections.abc import Generator
 from pathlib import Path
 
 import pytest
+import typer
+import typer.core
+import typer.main
+
+from claude_worktree.cli import app
+from claude_worktree.git_utils import close_persistent_git
 
 
 @pytest.fixture(autouse=True)
@@ -25,56 +35,77 @@ def isolate_config_globally(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.setenv("CW_AI_TOOL", "")
 
 
-@pytest.fixture
-def temp_git_repo(tmp_path: Path, monkeypatch) -> Generator[Path, None, None]:
-    """Create a temporary git repository for testing."""
-    repo_path = tmp_path / "test_repo"
+def _link_objects(src: str, dst: str) -> None:
+    """Hardlink immutable git objects and copy every other file."""
+    if f"{os.sep}.git{os.sep}objects{os.sep}" in src:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Initialize a repository with one commit on main, once per session."""
+    base = tmp_path_factory.mktemp("template")
+    repo_path = base / "test_repo"
     repo_path.mkdir()
 
-    # Initialize git repo
-    subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=repo_path,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=repo_path,
-        check=True,
-        capture_output=True,
-    )
-    # Disable GPG signing for tests
-    subprocess.run(
-        ["git", "config", "commit.gpgsign", "false"],
-        cwd=repo_path,
-        check=True,
-        capture_output=True,
-    )
-
-    # Create initial commit on main branch
-    (repo_path / "README.md").write_text("# Test Repository")
-    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=repo_path,
-        check=True,
-        capture_output=True,
-    )
-    # Ensure the default branch is named 'main' (git init may create 'master' in some environments)
-    subprocess.run(
-        ["git", "branch", "-M", "main"],
-        cwd=repo_path,
-        check=True,
-        capture_output=True,
-    )
+    # Same isolated HOME as the per-test fixtures see
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(base))
+        mp.setenv("USERPROFILE", str(base))  # Windows
+
+        # Initialize git repo
+        subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+        # Identity, and no GPG signing for tests, written without a git config fork each
+        with (repo_path / ".git" / "config").open("a") as f:
+            f.write(
+                "[user]\n\temail = test@example.com\n\tname = Test User\n"
+                "[commit]\n\tgpgsign = false\n"
+            )
+
+        # Create initial commit on main branch
+        (repo_path / "README.md").write_text("# Test Repository")
+        subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Initial commit"],
+            cwd=repo_path,
+            check=True,
+            capture_output=True,
+        )
+        # Ensure the default branch is named 'main' (git init may create 'master' in some environments)
+        subprocess.run(
+            ["git", "branch", "-M", "main"],
+            cwd=repo_path,
+            check=True,
+            capture_output=True,
+        )
+    return repo_path
+
+
+@pytest.fixture
+def temp_git_repo(
+    tmp_path: Path, monkeypatch, _git_repo_template: Path
+) -> Generator[Path, None, None]:
+    """Create a temporary git repository for testing.
+
+    Each test gets its own copy of the session template, so tests can
+    mutate it freely without paying for git init and the first commit.
+    """
+    repo_path = tmp_path / "test_repo"
+    shutil.copytree(_git_repo_template, repo_path, symlinks=True, copy_function=_link_objects)
 
     # Change to repo directory for tests
     monkeypatch.chdir(repo_path)
 
     yield repo_path
 
+    # Stop long-running git helpers before their worktrees are removed
+    close_persistent_git()
+
     # Cleanup: remove all worktrees
     try:
         result = subprocess.run(
@@ -114,3 +145,27 @@ def disable_claude(monkeypatch) -> None:
         return []
 
     monkeypatch.setattr(config, "get_ai_tool_command", mock_get_ai_tool_command)
+
+
+@pytest.fixture(scope="session")
+def help_texts() -> dict[str, str]:
+    """Render --help for the app ("cw") and each subcommand once per session.
+
+    Help is produced straight from the command tree, so the app
+    callback never runs and no CliRunner isolation is set up per test.
+    """
+    root = typer.main.get_command(app)
+    root_ctx = typer.Context(root, info_name="cw")
+    contexts = {"cw": root_ctx}
+    if isinstance(root, typer.core.TyperGroup):
+        for name, command in root.commands.items():
+            contexts[name] = typer.Context(command, info_name=name, parent=root_ctx)
+
+    texts = {}
+    for name, ctx in contexts.items():
+        # Typer's rich help is printed to stdout rather than returned
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            returned = ctx.get_help()
+        texts[name] = returned + buf.getvalue()
+    return texts
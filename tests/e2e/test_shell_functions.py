@@ -5,6 +5,7 @@ Tests verify that shell functions (cw-cd) work correctly across different shells
 Uses temporary files instead of process substitution for reliable CI testing.
 """
 
+import functools
 import subprocess
 import sys
 import tempfile
@@ -19,12 +20,22 @@ from claude_worktree.operations import create_worktree
 SKIP_ON_WINDOWS = pytest.mark.skipif(sys.platform == "win32", reason="Unix shell only")
 SKIP_ON_UNIX = pytest.mark.skipif(sys.platform != "win32", reason="Windows only")
 
+# Interpreter markers, decided at collection so skipped tests never set up fixtures
+SKIP_WITHOUT_ZSH = pytest.mark.skipif(not has_command("zsh"), reason="zsh not installed")
+SKIP_WITHOUT_FISH = pytest.mark.skipif(not has_command("fish"), reason="fish not installed")
+SKIP_WITHOUT_POWERSHELL = pytest.mark.skipif(
+    not has_command("pwsh") and not has_command("powershell"),
+    reason="PowerShell not installed",
+)
 
+
+@functools.cache
 def get_shell_function_script(shell: str) -> str:
     """Get shell function script content by running the CLI command.
 
     Uses subprocess to execute the command and capture output to avoid
-    process substitution issues in tests.
+    process substitution issues in tests. The scripts don't change during
+    a run, so each shell's output is generated once.
     """
     result = subprocess.run(
         [sys.executable, "-m", "claude_worktree", "_shell-function", shell],
@@ -172,14 +183,12 @@ class TestBashShellFunction:
 
 @pytest.mark.shell
 @SKIP_ON_WINDOWS
+@SKIP_WITHOUT_ZSH
 class TestZshShellFunction:
     """Test cw-cd in zsh shell."""
 
     def test_cw_cd_changes_directory(self, temp_git_repo: Path, disable_claude) -> None:
         """Test that cw-cd works in zsh."""
-        if not has_command("zsh"):
-            pytest.skip("zsh not installed")
-
         create_worktree(branch_name="test-zsh")
 
         script_content = get_shell_function_script("zsh")
@@ -210,14 +219,12 @@ class TestZshShellFunction:
 
 @pytest.mark.shell
 @SKIP_ON_WINDOWS
+@SKIP_WITHOUT_FISH
 class TestFishShellFunction:
     """Test cw-cd in fish shell."""
 
     def test_cw_cd_changes_directory(self, temp_git_repo: Path, disable_claude) -> None:
         """Test that cw-cd works in fish."""
-        if not has_command("fish"):
-            pytest.skip("fish not installed")
-
         create_worktree(branch_name="test-fish")
 
         script_content = get_shell_function_script("fish")
@@ -247,9 +254,6 @@ class TestFishShellFunction:
 
     def test_fish_tab_completion(self, temp_git_repo: Path, disable_claude) -> None:
         """Test fish tab completion for cw-cd."""
-        if not has_command("fish"):
-            pytest.skip("fish not installed")
-
         # Create worktrees
         create_worktree(branch_name="feature-x")
         create_worktree(branch_name="feature-y")
@@ -285,14 +289,12 @@ class TestFishShellFunction:
 
 @pytest.mark.shell
 @SKIP_ON_UNIX
+@SKIP_WITHOUT_POWERSHELL
 class TestPowerShellFunction:
     """Test cw-cd in PowerShell (Windows only)."""
 
     def test_cw_cd_changes_directory(self, temp_git_repo: Path, disable_claude) -> None:
         """Test that cw-cd works in PowerShell."""
-        if not has_command("pwsh") and not has_command("powershell"):
-            pytest.skip("PowerShell not installed")
-
         create_worktree(branch_name="test-pwsh")
 
         script_content = get_shell_function_script("powershell")
@@ -324,9 +326,6 @@ class TestPowerShellFunction:
 
     def test_cw_cd_error_handling_powershell(self, temp_git_repo: Path) -> None:
         """Test PowerShell error handling."""
-        if not has_command("pwsh") and not has_command("powershell"):
-            pytest.skip("PowerShell not installed")
-
         script_content = get_shell_function_script("powershell")
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".ps1", delete=False) as f:
@@ -369,11 +368,9 @@ class TestShellScriptSyntax:
         assert result.returncode == 0, f"Bash syntax error: {result.stderr}"
 
     @SKIP_ON_WINDOWS
+    @SKIP_WITHOUT_FISH
     def test_fish_script_syntax(self) -> None:
         """Validate fish script has no syntax errors."""
-        if not has_command("fish"):
-            pytest.skip("fish not installed")
-
         result = subprocess.run(
             ["fish", "-n", "src/claude_worktree/shell_functions/cw.fish"],
             capture_output=True,
@@ -382,11 +379,9 @@ class TestShellScriptSyntax:
         assert result.returncode == 0, f"Fish syntax error: {result.stderr}"
 
     @SKIP_ON_UNIX
+    @SKIP_WITHOUT_POWERSHELL
     def test_powershell_script_syntax(self) -> None:
         """Validate PowerShell script has no syntax errors."""
-        if not has_command("pwsh") and not has_command("powershell"):
-            pytest.skip("PowerShell not installed")
-
         pwsh_cmd = "pwsh" if has_command("pwsh") else "powershell"
 
         # Test script can be sourced without errors
@@ -403,11 +398,9 @@ class TestShellScriptSyntax:
         assert result.returncode == 0, f"PowerShell syntax error: {result.stderr}"
 
     @SKIP_ON_UNIX
+    @SKIP_WITHOUT_POWERSHELL
     def test_powershell_invoke_expression(self) -> None:
         """Validate PowerShell script works with Invoke-Expression (profile usage)."""
-        if not has_command("pwsh") and not has_command("powershell"):
-            pytest.skip("PowerShell not installed")
-
         pwsh_cmd = "pwsh" if has_command("pwsh") else "powershell"
 
         # Test actual usage pattern: pipe to Out-String then Invoke-Expression
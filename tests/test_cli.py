@@ -1,5 +1,6 @@
 """Tests for CLI interface - classicist style."""
 
+import contextlib
 import subprocess
 from pathlib import Path
 
@@ -10,11 +11,10 @@ from claude_worktree.cli import app
 runner = CliRunner()
 
 
-def test_cli_help() -> None:
+def test_cli_help(help_texts: dict[str, str]) -> None:
     """Test that help command works."""
-    result = runner.invoke(app, ["--help"])
-    assert result.exit_code == 0
-    assert "Claude Code × git worktree helper CLI" in result.stdout
+    help_text = help_texts["cw"]
+    assert "Claude Code × git worktree helper CLI" in help_text
 
 
 def test_cli_version() -> None:
@@ -24,11 +24,10 @@ def test_cli_version() -> None:
     assert "claude-worktree version" in result.stdout
 
 
-def test_new_command_help() -> None:
+def test_new_command_help(help_texts: dict[str, str]) -> None:
     """Test new command help."""
-    result = runner.invoke(app, ["new", "--help"])
-    assert result.exit_code == 0
-    assert "Create a new worktree" in result.stdout
+    help_text = help_texts["new"]
+    assert "Create a new worktree" in help_text
 
 
 def test_new_command_execution(temp_git_repo: Path, disable_claude) -> None:
@@ -47,9 +46,8 @@ def test_new_command_execution(temp_git_repo: Path, disable_claude) -> None:
         ["git", "branch", "--list", "test-feature"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "test-feature" in git_result.stdout
+    assert b"test-feature" in git_result.stdout
 
 
 def test_new_command_with_base(temp_git_repo: Path, disable_claude) -> None:
@@ -59,7 +57,8 @@ def test_new_command_with_base(temp_git_repo: Path, disable_claude) -> None:
         ["git", "branch", "develop"],
         cwd=temp_git_repo,
         check=True,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
 
     result = runner.invoke(app, ["new", "from-develop", "--base", "develop"])
@@ -88,11 +87,10 @@ def test_new_command_invalid_base(temp_git_repo: Path) -> None:
     assert "Error" in result.stdout
 
 
-def test_list_command_help() -> None:
+def test_list_command_help(help_texts: dict[str, str]) -> None:
     """Test list command help."""
-    result = runner.invoke(app, ["list", "--help"])
-    assert result.exit_code == 0
-    assert "List all worktrees" in result.stdout
+    help_text = help_texts["list"]
+    assert "List all worktrees" in help_text
 
 
 def test_list_command_execution(temp_git_repo: Path, disable_claude) -> None:
@@ -108,33 +106,29 @@ def test_list_command_execution(temp_git_repo: Path, disable_claude) -> None:
     assert "wt2" in result.stdout
 
 
-def test_status_command_help() -> None:
+def test_status_command_help(help_texts: dict[str, str]) -> None:
     """Test status command help."""
-    result = runner.invoke(app, ["status", "--help"])
-    assert result.exit_code == 0
-    assert "Show status" in result.stdout
+    help_text = help_texts["status"]
+    assert "Show status" in help_text
 
 
-def test_status_command_execution(temp_git_repo: Path, disable_claude, monkeypatch) -> None:
+def test_status_command_execution(temp_git_repo: Path, disable_claude) -> None:
     """Test status command from within worktree."""
     # Create worktree
     runner.invoke(app, ["new", "status-test"])
     worktree_path = temp_git_repo.parent / f"{temp_git_repo.name}-status-test"
 
-    # Change to worktree
-    monkeypatch.chdir(worktree_path)
-
-    # Show status
-    result = runner.invoke(app, ["status"])
+    # Show status from inside the worktree
+    with contextlib.chdir(worktree_path):
+        result = runner.invoke(app, ["status"])
     assert result.exit_code == 0
     assert "status-test" in result.stdout
 
 
-def test_delete_command_help() -> None:
+def test_delete_command_help(help_texts: dict[str, str]) -> None:
     """Test delete command help."""
-    result = runner.invoke(app, ["delete", "--help"])
-    assert result.exit_code == 0
-    assert "Delete a worktree" in result.stdout
+    help_text = help_texts["delete"]
+    assert "Delete a worktree" in help_text
 
 
 def test_delete_command_by_branch(temp_git_repo: Path, disable_claude) -> None:
@@ -182,9 +176,8 @@ def test_delete_command_keep_branch(temp_git_repo: Path, disable_claude) -> None
         ["git", "branch", "--list", "keep-br"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "keep-br" in git_result.stdout
+    assert b"keep-br" in git_result.stdout
 
 
 def test_new_command_with_iterm_tab_flag(temp_git_repo: Path, disable_claude) -> None:
@@ -196,9 +189,6 @@ def test_new_command_with_iterm_tab_flag(temp_git_repo: Path, disable_claude) ->
     expected_path = temp_git_repo.parent / f"{temp_git_repo.name}-iterm-tab-test"
     assert expected_path.exists()
 
-    # Clean up
-    runner.invoke(app, ["delete", "iterm-tab-test"])
-
 
 def test_resume_command_with_iterm_tab_flag(temp_git_repo: Path, disable_claude) -> None:
     """Test that resume command accepts --iterm-tab flag."""
@@ -209,16 +199,12 @@ def test_resume_command_with_iterm_tab_flag(temp_git_repo: Path, disable_claude)
     result = runner.invoke(app, ["resume", "resume-tab-test"])
     assert result.exit_code == 0
 
-    # Clean up
-    runner.invoke(app, ["delete", "resume-tab-test"])
-
 
-def test_shell_command_help() -> None:
+def test_shell_command_help(help_texts: dict[str, str]) -> None:
     """Test shell command help."""
-    result = runner.invoke(app, ["shell", "--help"])
-    assert result.exit_code == 0
-    assert "shell" in result.stdout.lower()
-    assert "command" in result.stdout.lower()
+    help_text = help_texts["shell"]
+    assert "shell" in help_text.lower()
+    assert "command" in help_text.lower()
 
 
 def test_shell_command_with_branch_and_command(temp_git_repo: Path, disable_claude) -> None:
@@ -238,9 +224,6 @@ def test_shell_command_with_branch_and_command(temp_git_repo: Path, disable_clau
     path_no_ws = str(worktree_path).replace(" ", "")
     assert path_no_ws in stdout_no_ws
 
-    # Clean up
-    runner.invoke(app, ["delete", "shell-test"])
-
 
 def test_shell_command_nonexistent_branch(temp_git_repo: Path) -> None:
     """Test shell command with nonexistent branch."""
@@ -249,89 +232,78 @@ def test_shell_command_nonexistent_branch(temp_git_repo: Path) -> None:
     assert "Error" in result.stdout
 
 
-def test_sync_command_help(temp_git_repo: Path) -> None:
+def test_sync_command_help(help_texts: dict[str, str]) -> None:
     """Test sync command help."""
-    result = runner.invoke(app, ["sync", "--help"])
-    assert result.exit_code == 0
-    assert "Synchronize worktree" in result.stdout
+    help_text = help_texts["sync"]
+    assert "Synchronize worktree" in help_text
 
 
-def test_sync_command_accepts_flags(temp_git_repo: Path, disable_claude) -> None:
+def test_sync_command_accepts_flags(help_texts: dict[str, str]) -> None:
     """Test sync command accepts all flags."""
-    result = runner.invoke(app, ["sync", "--help"])
-    assert result.exit_code == 0
+    help_text = help_texts["sync"]
     # Check for flag names (ANSI codes may be present in colored output)
-    assert "all" in result.stdout and "Sync all worktrees" in result.stdout
-    assert (
-        "fetch" in result.stdout and "only" in result.stdout and "without rebasing" in result.stdout
-    )
+    assert "all" in help_text and "Sync all worktrees" in help_text
+    assert "fetch" in help_text and "only" in help_text and "without rebasing" in help_text
 
 
-def test_clean_command_help(temp_git_repo: Path) -> None:
+def test_clean_command_help(help_texts: dict[str, str]) -> None:
     """Test clean command help."""
-    result = runner.invoke(app, ["clean", "--help"])
-    assert result.exit_code == 0
-    assert "Batch cleanup of worktrees" in result.stdout
+    help_text = help_texts["clean"]
+    assert "Batch cleanup of worktrees" in help_text
 
 
-def test_clean_command_accepts_flags(temp_git_repo: Path, disable_claude) -> None:
+def test_clean_command_accepts_flags(help_texts: dict[str, str]) -> None:
     """Test clean command accepts all flags."""
-    result = runner.invoke(app, ["clean", "--help"])
-    assert result.exit_code == 0
+    help_text = help_texts["clean"]
     # Check for flag names (ANSI codes may be present in colored output)
-    assert "merged" in result.stdout and "branches already merged" in result.stdout
-    assert "older" in result.stdout and "than" in result.stdout and "days" in result.stdout
-    assert "interactive" in result.stdout.lower() or "-i" in result.stdout
-    assert "dry" in result.stdout and "run" in result.stdout
+    assert "merged" in help_text and "branches already merged" in help_text
+    assert "older" in help_text and "than" in help_text and "days" in help_text
+    assert "interactive" in help_text.lower() or "-i" in help_text
+    assert "dry" in help_text and "run" in help_text
     # Check that auto-prune is mentioned in help
-    assert "prune" in result.stdout.lower()
+    assert "prune" in help_text.lower()
 
 
-def test_pr_command_help(temp_git_repo: Path) -> None:
+def test_pr_command_help(help_texts: dict[str, str]) -> None:
     """Test pr command help."""
-    result = runner.invoke(app, ["pr", "--help"])
-    assert result.exit_code == 0
-    assert "pull request" in result.stdout.lower() or "pull-request" in result.stdout.lower()
-    assert "GitHub" in result.stdout
+    help_text = help_texts["pr"]
+    assert "pull request" in help_text.lower() or "pull-request" in help_text.lower()
+    assert "GitHub" in help_text
 
 
-def test_pr_command_flags(temp_git_repo: Path) -> None:
+def test_pr_command_flags(help_texts: dict[str, str]) -> None:
     """Test pr command accepts all flags."""
-    result = runner.invoke(app, ["pr", "--help"])
-    assert result.exit_code == 0
+    help_text = help_texts["pr"]
     # Check for flag names (handle ANSI color codes by checking components)
-    assert "no" in result.stdout and "push" in result.stdout
-    assert "title" in result.stdout and "-t" in result.stdout
-    assert "body" in result.stdout and "-b" in result.stdout
-    assert "draft" in result.stdout
+    assert "no" in help_text and "push" in help_text
+    assert "title" in help_text and "-t" in help_text
+    assert "body" in help_text and "-b" in help_text
+    assert "draft" in help_text
 
 
-def test_merge_command_help(temp_git_repo: Path) -> None:
+def test_merge_command_help(help_texts: dict[str, str]) -> None:
     """Test merge command help."""
-    result = runner.invoke(app, ["merge", "--help"])
-    assert result.exit_code == 0
-    assert "merge" in result.stdout.lower()
-    assert "base branch" in result.stdout.lower()
+    help_text = help_texts["merge"]
+    assert "merge" in help_text.lower()
+    assert "base branch" in help_text.lower()
 
 
-def test_merge_command_flags(temp_git_repo: Path) -> None:
+def test_merge_command_flags(help_texts: dict[str, str]) -> None:
     """Test merge command accepts all flags."""
-    result = runner.invoke(app, ["merge", "--help"])
-    assert result.exit_code == 0
+    help_text = help_texts["merge"]
     # Check for flag names (handle ANSI color codes by checking components)
-    assert "push" in result.stdout
-    assert "interactive" in result.stdout and "-i" in result.stdout
-    assert "dry" in result.stdout and "run" in result.stdout
+    assert "push" in help_text
+    assert "interactive" in help_text and "-i" in help_text
+    assert "dry" in help_text and "run" in help_text
 
 
 # Shell function tests
 
 
-def test_shell_function_help() -> None:
+def test_shell_function_help(help_texts: dict[str, str]) -> None:
     """Test _shell-function command help."""
-    result = runner.invoke(app, ["_shell-function", "--help"])
-    assert result.exit_code == 0
-    assert "shell function" in result.stdout.lower()
+    help_text = help_texts["_shell-function"]
+    assert "shell function" in help_text.lower()
 
 
 def test_shell_function_bash() -> None:
@@ -383,12 +355,11 @@ def test_shell_function_invalid_shell() -> None:
     assert "Error" in result.stderr or "Invalid" in result.stderr
 
 
-def test_shell_setup_help() -> None:
+def test_shell_setup_help(help_texts: dict[str, str]) -> None:
     """Test shell-setup command help."""
-    result = runner.invoke(app, ["shell-setup", "--help"])
-    assert result.exit_code == 0
-    assert "shell" in result.stdout.lower()
-    assert "setup" in result.stdout.lower() or "install" in result.stdout.lower()
+    help_text = help_texts["shell-setup"]
+    assert "shell" in help_text.lower()
+    assert "setup" in help_text.lower() or "install" in help_text.lower()
 
 
 # Branch completion tests
@@ -410,29 +381,29 @@ def test_complete_all_branches_includes_remote(temp_git_repo: Path, tmp_path: Pa
     remote_path = tmp_path / "remote_repo.git"
     subprocess.run(
         ["git", "clone", "--bare", str(temp_git_repo), str(remote_path)],
-        check=True, capture_output=True,
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
 
     # Add the bare repo as a remote and push a remote-only branch
     subprocess.run(
         ["git", "remote", "add", "origin", str(remote_path)],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "branch", "remote-feature"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "push", "origin", "remote-feature"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "branch", "-D", "remote-feature"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "fetch", "origin"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
 
     branches = complete_all_branches()
@@ -452,7 +423,7 @@ def test_complete_new_branch_names_excludes_worktrees(
     # Create a branch and worktree
     subprocess.run(
         ["git", "branch", "available-branch"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
 
     # Create worktree for another branch
@@ -502,15 +473,15 @@ def test_get_all_branch_names_filters_head(temp_git_repo: Path, tmp_path: Path)
     remote_path = tmp_path / "remote_repo.git"
     subprocess.run(
         ["git", "clone", "--bare", str(temp_git_repo), str(remote_path)],
-        check=True, capture_output=True,
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "remote", "add", "origin", str(remote_path)],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "fetch", "origin"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
 
     branches = _get_all_branch_names()
@@ -531,29 +502,29 @@ def test_get_all_branch_names_with_slashes(temp_git_repo: Path, tmp_path: Path)
     remote_path = tmp_path / "remote_repo.git"
     subprocess.run(
         ["git", "clone", "--bare", str(temp_git_repo), str(remote_path)],
-        check=True, capture_output=True,
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "remote", "add", "origin", str(remote_path)],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
 
     # Create and push branch with slashes
     subprocess.run(
         ["git", "branch", "feature/auth/login"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "push", "origin", "feature/auth/login"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "branch", "-D", "feature/auth/login"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "fetch", "origin"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
 
     branches = _get_all_branch_names()
@@ -571,15 +542,15 @@ def test_get_all_branch_names_deduplicates(temp_git_repo: Path, tmp_path: Path)
     remote_path = tmp_path / "remote_repo.git"
     subprocess.run(
         ["git", "clone", "--bare", str(temp_git_repo), str(remote_path)],
-        check=True, capture_output=True,
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "remote", "add", "origin", str(remote_path)],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "fetch", "origin"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
 
     branches = _get_all_branch_names()
@@ -598,29 +569,29 @@ def test_complete_new_branch_names_includes_remote(
     remote_path = tmp_path / "remote_repo.git"
     subprocess.run(
         ["git", "clone", "--bare", str(temp_git_repo), str(remote_path)],
-        check=True, capture_output=True,
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "remote", "add", "origin", str(remote_path)],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
 
     # Push a branch to remote only
     subprocess.run(
         ["git", "branch", "remote-only"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "push", "origin", "remote-only"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "branch", "-D", "remote-only"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "fetch", "origin"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
 
     names = complete_new_branch_names()
@@ -640,25 +611,25 @@ def test_new_command_with_remote_branch(
     remote_path = tmp_path / "remote_repo.git"
     subprocess.run(
         ["git", "clone", "--bare", str(temp_git_repo), str(remote_path)],
-        check=True, capture_output=True,
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "remote", "add", "origin", str(remote_path)],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
 
     # Create a remote-only branch
     subprocess.run(
         ["git", "branch", "remote-cli-test"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "push", "origin", "remote-cli-test"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     subprocess.run(
         ["git", "branch", "-D", "remote-cli-test"],
-        cwd=temp_git_repo, check=True, capture_output=True,
+        cwd=temp_git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
 
     result = runner.invoke(app, ["new", "remote-cli-test"])
@@ -669,6 +640,3 @@ def test_new_command_with_remote_branch(
     # Verify worktree was created
     expected_path = temp_git_repo.parent / f"{temp_git_repo.name}-remote-cli-test"
     assert expected_path.exists()
-
-    # Clean up
-    runner.invoke(app, ["delete", "remote-cli-test"])
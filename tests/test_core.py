@@ -1,5 +1,6 @@
 """Tests for core module - classicist style with real git operations."""
 
+import os
 import subprocess
 from pathlib import Path
 
@@ -44,9 +45,8 @@ def test_create_worktree_basic(temp_git_repo: Path, disable_claude) -> None:
         ["git", "branch", "--list", "fix-auth"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "fix-auth" in result.stdout
+    assert b"fix-auth" in result.stdout
 
     # Verify worktree is registered
     result = subprocess.run(
@@ -139,9 +139,8 @@ def test_finish_worktree_success(temp_git_repo: Path, disable_claude, monkeypatc
         ["git", "branch", "--list", "finish-test"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "finish-test" not in result.stdout
+    assert b"finish-test" not in result.stdout
 
     # Verify changes were merged to main
     assert (temp_git_repo / "test.txt").exists()
@@ -226,9 +225,8 @@ def test_finish_worktree_dry_run(temp_git_repo: Path, disable_claude, monkeypatc
         ["git", "branch", "--list", "dry-run-test"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "dry-run-test" in result.stdout
+    assert b"dry-run-test" in result.stdout
 
     # Changes should NOT be merged to main
     assert not (temp_git_repo / "feature.txt").exists()
@@ -264,9 +262,8 @@ def test_delete_worktree_by_branch(temp_git_repo: Path, disable_claude) -> None:
         ["git", "branch", "--list", "delete-me"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "delete-me" not in result.stdout
+    assert b"delete-me" not in result.stdout
 
 
 def test_delete_worktree_by_path(temp_git_repo: Path, disable_claude) -> None:
@@ -301,9 +298,8 @@ def test_delete_worktree_keep_branch(temp_git_repo: Path, disable_claude) -> Non
         ["git", "branch", "--list", "keep-branch"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "keep-branch" in result.stdout
+    assert b"keep-branch" in result.stdout
 
 
 def test_delete_worktree_not_found(temp_git_repo: Path) -> None:
@@ -420,6 +416,126 @@ def test_get_worktree_status_active(temp_git_repo: Path, disable_claude, monkeyp
     assert status == "active"
 
 
+def test_get_worktree_status_sibling_prefix_not_active(
+    temp_git_repo: Path, disable_claude
+) -> None:
+    """Test that a cwd sharing only a string prefix with the worktree is not active."""
+    worktree_path = create_worktree(branch_name="prefix")
+    sibling = worktree_path.parent / f"{worktree_path.name}-other"
+
+    status = get_worktree_status(str(worktree_path), temp_git_repo, cwd=sibling)
+    assert status == "clean"
+
+
+def test_get_worktree_metadata_infers_default_branch(temp_git_repo: Path) -> None:
+    """Test that missing metadata falls back to the repo's default branch."""
+    from claude_worktree.operations.helpers import get_worktree_metadata
+
+    subprocess.run(
+        ["git", "branch", "develop"], cwd=temp_git_repo, check=True, capture_output=True
+    )
+    worktree_path = temp_git_repo.parent / "no-metadata"
+    subprocess.run(
+        ["git", "worktree", "add", "-b", "no-metadata", str(worktree_path)],
+        cwd=temp_git_repo,
+        check=True,
+        capture_output=True,
+    )
+
+    base_branch, base_path = get_worktree_metadata("no-metadata", temp_git_repo)
+    assert base_branch == "main"
+    assert base_path.resolve() == temp_git_repo.resolve()
+
+
+def test_relative_path(tmp_path: Path) -> None:
+    """Test display paths for nested and sibling worktrees."""
+    from claude_worktree.operations.display import _relative_path
+
+    repo = tmp_path / "repo"
+    assert _relative_path(repo / ".worktrees" / "feat", repo) == os.path.join(".worktrees", "feat")
+    assert _relative_path(tmp_path / "repo-feat", repo) == os.path.join("..", "repo-feat")
+    assert _relative_path(tmp_path / "repo2", repo) == os.path.join("..", "repo2")
+
+
+def test_get_branch_for_worktree(temp_git_repo: Path) -> None:
+    """Test branch lookup by worktree path, including detached worktrees."""
+    from claude_worktree.operations.helpers import _get_branch_for_worktree
+
+    feature_path = temp_git_repo.parent / "branch-lookup"
+    detached_path = temp_git_repo.parent / "detached-lookup"
+    subprocess.run(
+        ["git", "worktree", "add", "-b", "branch-lookup", str(feature_path), "HEAD"],
+        cwd=temp_git_repo,
+        capture_output=True,
+        check=True,
+    )
+    subprocess.run(
+        ["git", "worktree", "add", "--detach", str(detached_path), "HEAD"],
+        cwd=temp_git_repo,
+        capture_output=True,
+        check=True,
+    )
+
+    assert _get_branch_for_worktree(temp_git_repo, feature_path) == "branch-lookup"
+    assert _get_branch_for_worktree(temp_git_repo, detached_path) is None
+    assert _get_branch_for_worktree(temp_git_repo, temp_git_repo.parent / "missing") is None
+
+
+def test_same_path(tmp_path: Path) -> None:
+    """Test resolved path comparison through symlinks and for missing paths."""
+    from claude_worktree.operations.helpers import _same_path
+
+    real = tmp_path / "real"
+    real.mkdir()
+    assert _same_path(real, tmp_path / "x" / ".." / "real")
+    assert not _same_path(real, tmp_path / "missing")
+    if os.name != "nt":
+        (tmp_path / "link").symlink_to(real)
+        assert _same_path(tmp_path / "link", real)
+
+
+def test_resolve_worktree_target_fast_path(temp_git_repo: Path, monkeypatch) -> None:
+    """Test that a checked-out branch resolves without the config lookups."""
+    from claude_worktree.operations import helpers
+
+    feature_path = temp_git_repo.parent / "fast-path"
+    shadow_path = temp_git_repo.parent / "shadowed"
+    for branch, path in (("fast-path", feature_path), ("other", shadow_path)):
+        subprocess.run(
+            ["git", "worktree", "add", "-b", branch, str(path), "HEAD"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            check=True,
+        )
+    # A branch named after another worktree's directory needs disambiguation
+    subprocess.run(
+        ["git", "checkout", "-b", "shadowed"],
+        cwd=feature_path,
+        capture_output=True,
+        check=True,
+    )
+
+    index = helpers._build_target_index(temp_git_repo)
+    assert index["shadowed"] is None
+    assert "fast-path" not in index
+
+    subprocess.run(
+        ["git", "checkout", "fast-path"],
+        cwd=feature_path,
+        capture_output=True,
+        check=True,
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError("slow lookup should not run")
+
+    monkeypatch.setattr(helpers, "find_worktree_by_intended_branch", fail)
+    monkeypatch.setattr(helpers, "find_worktree_by_name", fail)
+    path, branch, _ = helpers.resolve_worktree_target("fast-path")
+    assert path.resolve() == feature_path.resolve()
+    assert branch == "fast-path"
+
+
 def test_get_worktree_status_modified(temp_git_repo: Path, disable_claude) -> None:
     """Test status detection for modified worktree (uncommitted changes)."""
     # Create worktree
@@ -671,14 +787,12 @@ def test_launch_ai_tool_with_iterm_tab(temp_git_repo: Path, mocker) -> None:
     assert mock_run.called
     call_args = mock_run.call_args
 
-    # Verify the command includes osascript and expected iTerm tab commands
+    # Verify the AppleScript is piped directly to osascript
     command = call_args[0][0]
-    assert command[0] == "bash"
-    assert command[1] == "-lc"
+    assert command == ["osascript", "-"]
 
     # Verify AppleScript content
-    script = command[2]
-    assert "osascript" in script
+    script = call_args[1]["input"]
     assert 'tell application "iTerm"' in script
     assert "create tab with default profile" in script
     assert "tell current window" in script
@@ -811,9 +925,8 @@ def test_merge_worktree_success(temp_git_repo: Path, disable_claude, monkeypatch
         ["git", "branch", "--list", "merge-test"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "merge-test" not in result.stdout
+    assert b"merge-test" not in result.stdout
 
     # Verify changes were merged to main
     assert (temp_git_repo / "merge.txt").exists()
@@ -895,9 +1008,8 @@ def test_merge_worktree_dry_run(temp_git_repo: Path, disable_claude, monkeypatch
         ["git", "branch", "--list", "merge-dry-run-test"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "merge-dry-run-test" in result.stdout
+    assert b"merge-dry-run-test" in result.stdout
 
     # Changes should NOT be merged to main
     assert not (temp_git_repo / "feature.txt").exists()
@@ -1383,9 +1495,8 @@ def test_create_worktree_existing_branch_non_interactive(
         ["git", "branch", "--list", "existing-branch"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "existing-branch" in result.stdout
+    assert b"existing-branch" in result.stdout
 
     # Create worktree from existing branch (non-interactive mode should proceed)
     worktree_path = create_worktree(
@@ -1425,9 +1536,8 @@ def test_delete_worktree_current_directory(
         ["git", "branch", "--list", "delete-current"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "delete-current" not in result.stdout
+    assert b"delete-current" not in result.stdout
 
 
 def test_delete_worktree_current_directory_main_repo_error(
@@ -1463,9 +1573,8 @@ def test_delete_worktree_by_worktree_name(temp_git_repo: Path, disable_claude) -
         ["git", "branch", "--list", "feature-test"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "feature-test" not in result.stdout
+    assert b"feature-test" not in result.stdout
 
 
 def test_delete_worktree_with_branch_flag(temp_git_repo: Path, disable_claude) -> None:
@@ -1488,9 +1597,8 @@ def test_delete_worktree_with_branch_flag(temp_git_repo: Path, disable_claude) -
         ["git", "branch", "--list", "branch-flag-test"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "branch-flag-test" not in result.stdout
+    assert b"branch-flag-test" not in result.stdout
 
 
 def test_delete_worktree_with_worktree_flag(temp_git_repo: Path, disable_claude) -> None:
@@ -1567,9 +1675,8 @@ def test_delete_worktree_from_inside_with_different_branch(
         ["git", "branch", "--list", "original-branch"],
         cwd=temp_git_repo,
         capture_output=True,
-        text=True,
     )
-    assert "original-branch" not in result.stdout
+    assert b"original-branch" not in result.stdout
 
 
 def test_delete_worktree_ambiguous_non_interactive(
@@ -2026,3 +2133,153 @@ def test_delete_worktree_created_from_remote(
     from claude_worktree.git_utils import branch_exists
 
     assert not branch_exists("delete-remote-test", temp_git_repo)
+
+
+def test_doctor_reports_worktree_behind_base(
+    temp_git_repo: Path, disable_claude, tmp_path: Path, capsys
+) -> None:
+    """Test that doctor reports feature worktrees that are behind origin/<base>."""
+    from claude_worktree.operations import doctor
+
+    remote_path = tmp_path / "remote_repo.git"
+    subprocess.run(
+        ["git", "clone", "--bare", str(temp_git_repo), str(remote_path)],
+        check=True, capture_output=True,
+    )
+    subprocess.run(
+        ["git", "remote", "add", "origin", str(remote_path)],
+        cwd=temp_git_repo, check=True, capture_output=True,
+    )
+
+    create_worktree(branch_name="doctor-behind")
+
+    # Advance main on the remote so the feature branch falls behind
+    (temp_git_repo / "new.txt").write_text("new")
+    subprocess.run(["git", "add", "."], cwd=temp_git_repo, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Advance main"],
+        cwd=temp_git_repo, check=True, capture_output=True,
+    )
+    subprocess.run(
+        ["git", "push", "origin", "main"],
+        cwd=temp_git_repo, check=True, capture_output=True,
+    )
+
+    doctor()
+
+    captured = capsys.readouterr()
+    assert "doctor-behind: 1 commit(s) behind main" in captured.out
+    assert "No merge conflicts detected" in captured.out
+
+
+def test_doctor_inflight_probe_is_shared(monkeypatch) -> None:
+    """Test that concurrent callers of the same probe share a single execution."""
+    import threading
+
+    from claude_worktree.operations.diagnostics import _get_or_create_inflight, _inflight
+
+    started = threading.Event()
+    joined = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def probe() -> str:
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return "done"
+
+    key = ("status", Path("/tmp/inflight-test"))
+    results: list[str] = []
+    owner = threading.Thread(target=lambda: results.append(_get_or_create_inflight(key, probe)))
+    owner.start()
+    assert started.wait(timeout=5)
+
+    # Signal when a second caller starts waiting on the owner's future
+    future = _inflight[key]
+    wait_for_result = future.result
+
+    def result(timeout: float | None = None) -> str:
+        joined.set()
+        return wait_for_result(timeout)
+
+    monkeypatch.setattr(future, "result", result)
+
+    joiner = threading.Thread(target=lambda: results.append(_get_or_create_inflight(key, probe)))
+    joiner.start()
+    assert joined.wait(timeout=5)
+    release.set()
+    owner.join(timeout=5)
+    joiner.join(timeout=5)
+
+    assert results == ["done", "done"]
+    assert len(calls) == 1
+
+
+def test_diff_worktrees_full_diff(temp_git_repo: Path, capsys) -> None:
+    """Test full diff output between two branches."""
+    from claude_worktree.operations import diff_worktrees
+
+    subprocess.run(
+        ["git", "checkout", "-b", "diff-feature"],
+        cwd=temp_git_repo, check=True, capture_output=True,
+    )
+    (temp_git_repo / "feature.txt").write_text("[bold]not markup[/bold]\n")
+    subprocess.run(["git", "add", "."], cwd=temp_git_repo, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Add feature"], cwd=temp_git_repo, check=True, capture_output=True
+    )
+
+    diff_worktrees("main", "diff-feature")
+
+    captured = capsys.readouterr()
+    assert "+++ b/feature.txt" in captured.out
+    assert "+[bold]not markup[/bold]" in captured.out
+
+
+def test_diff_worktrees_no_differences(temp_git_repo: Path, capsys) -> None:
+    """Test diff output when branches are identical."""
+    from claude_worktree.operations import diff_worktrees
+
+    subprocess.run(
+        ["git", "branch", "diff-same"], cwd=temp_git_repo, check=True, capture_output=True
+    )
+
+    diff_worktrees("main", "diff-same")
+
+    captured = capsys.readouterr()
+    assert "No differences found" in captured.out
+
+
+def test_diff_worktrees_files(temp_git_repo: Path, capsys) -> None:
+    """Test --files output lists each changed file with its status."""
+    from claude_worktree.operations import diff_worktrees
+
+    subprocess.run(
+        ["git", "checkout", "-b", "diff-files"],
+        cwd=temp_git_repo, check=True, capture_output=True,
+    )
+    (temp_git_repo / "added.txt").write_text("added\n")
+    (temp_git_repo / "README.md").write_text("# Changed\n")
+    subprocess.run(["git", "add", "."], cwd=temp_git_repo, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Change files"], cwd=temp_git_repo, check=True, capture_output=True
+    )
+
+    diff_worktrees("main", "diff-files", files=True)
+
+    captured = capsys.readouterr()
+    assert "added.txt (Added)" in captured.out
+    assert "README.md (Modified)" in captured.out
+
+
+def test_git_version_tuple() -> None:
+    """Test git version parsing for the doctor version check."""
+    from claude_worktree.operations.diagnostics import _git_version_tuple
+
+    assert _git_version_tuple("2.39.0") == (2, 39, 0)
+    assert _git_version_tuple("2.39.0.windows.1") == (2, 39, 0)
+    assert _git_version_tuple("2.31.0") >= (2, 31, 0)
+    assert _git_version_tuple("2.9.5") < (2, 31, 0)
+    with pytest.raises(ValueError):
+        _git_version_tuple("unknown")
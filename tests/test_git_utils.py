@@ -1,6 +1,8 @@
 """Tests for git_utils module."""
 
+import os
 import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -8,16 +10,26 @@ import pytest
 from claude_worktree.exceptions import GitError, InvalidBranchError
 from claude_worktree.git_utils import (
     branch_exists,
+    close_persistent_git,
     find_worktree_by_branch,
+    find_worktree_by_branch_or_name,
+    first_existing_branch,
     get_config,
     get_current_branch,
+    get_git_dir,
+    get_persistent_git,
     get_repo_root,
+    git_command,
+    git_stream_lines,
     has_command,
     normalize_branch_name,
+    parse_worktree_branches,
     parse_worktrees,
     remote_branch_exists,
     set_config,
     unset_config,
+    worktree_index,
+    worktree_path_index,
 )
 
 
@@ -60,6 +72,38 @@ def test_get_repo_root_not_in_repo(tmp_path: Path, monkeypatch) -> None:
         get_repo_root()
 
 
+def test_git_command_read_only(temp_git_repo: Path) -> None:
+    """Test that read-only git commands skip optional locks."""
+    result = git_command("status", "--porcelain", repo=temp_git_repo, capture=True, read_only=True)
+    assert result.returncode == 0
+
+    with pytest.raises(GitError, match="git --no-optional-locks rev-list"):
+        git_command("rev-list", "--count", "no-such-ref", repo=temp_git_repo, read_only=True)
+
+
+def test_git_stream_lines(temp_git_repo: Path) -> None:
+    """Test streaming git output line by line."""
+    lines = list(git_stream_lines("log", "--format=%s", repo=temp_git_repo))
+    assert lines == ["Initial commit\n"]
+
+
+def test_git_stream_lines_failure(temp_git_repo: Path) -> None:
+    """Test that a failing streamed command raises GitError."""
+    with pytest.raises(GitError, match="Command failed") as exc_info:
+        list(git_stream_lines("log", "no-such-branch", repo=temp_git_repo))
+    # git's own error message is carried in the exception
+    assert "ambiguous argument" in str(exc_info.value)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a POSIX shell alias")
+def test_git_stream_lines_large_stderr(temp_git_repo: Path) -> None:
+    """Test that stderr larger than a pipe buffer doesn't stall the stream."""
+    script = "import sys; sys.stderr.write('x' * 200000); print('done')"
+    alias = f"alias.noisy=!'{sys.executable}' -c \"{script}\""
+    lines = list(git_stream_lines("-c", alias, "noisy", repo=temp_git_repo))
+    assert lines == ["done\n"]
+
+
 def test_get_current_branch(temp_git_repo: Path) -> None:
     """Test getting current branch name."""
     branch = get_current_branch(temp_git_repo)
@@ -67,6 +111,25 @@ def test_get_current_branch(temp_git_repo: Path) -> None:
     assert branch in ("main", "master")
 
 
+def test_get_current_branch_linked_worktree_without_git(temp_git_repo: Path, monkeypatch) -> None:
+    """Test that the branch of a linked worktree is read from its HEAD file."""
+    from claude_worktree import git_utils
+
+    feature_path = temp_git_repo.parent / "head-read"
+    subprocess.run(
+        ["git", "worktree", "add", "-b", "head-read", str(feature_path), "HEAD"],
+        cwd=temp_git_repo,
+        capture_output=True,
+        check=True,
+    )
+
+    def no_git(*args, **kwargs):
+        raise AssertionError(f"unexpected git call: {args}")
+
+    monkeypatch.setattr(git_utils, "git_command", no_git)
+    assert get_current_branch(feature_path) == "head-read"
+
+
 def test_get_current_branch_detached(temp_git_repo: Path, monkeypatch) -> None:
     """Test error when in detached HEAD state."""
     # Get current commit hash
@@ -111,6 +174,27 @@ def test_branch_exists(temp_git_repo: Path) -> None:
     assert branch_exists("test-branch", temp_git_repo)
 
 
+def test_branch_exists_persistent_process(temp_git_repo: Path, tmp_path: Path) -> None:
+    """Test that branch lookups share one cat-file process and see new refs."""
+    assert not branch_exists("later-branch", temp_git_repo)
+    persistent = get_persistent_git(temp_git_repo)
+
+    subprocess.run(
+        ["git", "branch", "later-branch"], cwd=temp_git_repo, check=True, capture_output=True
+    )
+    assert branch_exists("later-branch", temp_git_repo)
+    assert get_persistent_git(temp_git_repo) is persistent
+    assert persistent.resolve("bad\nname") is None
+
+    # Outside a repository the lookup falls back to rev-parse and reports False
+    not_a_repo = tmp_path / "not_a_repo"
+    not_a_repo.mkdir()
+    assert not branch_exists("main", not_a_repo)
+
+    close_persistent_git()
+    assert get_persistent_git(temp_git_repo) is not persistent
+
+
 def test_remote_branch_exists(temp_git_repo: Path) -> None:
     """Test checking if a remote branch exists."""
     # No remote configured - should return False
@@ -303,6 +387,119 @@ def test_parse_worktrees_multiple(temp_git_repo: Path) -> None:
     assert "refs/heads/feature-branch" in branches
 
 
+def test_parse_worktree_branches(temp_git_repo: Path) -> None:
+    """Test that parse_worktree_branches normalizes branches at the source."""
+    feature_path = temp_git_repo.parent / "short"
+    subprocess.run(
+        ["git", "worktree", "add", "--detach", str(feature_path), "HEAD"],
+        cwd=temp_git_repo,
+        capture_output=True,
+        check=True,
+    )
+
+    assert parse_worktree_branches(temp_git_repo) == [
+        ("main", temp_git_repo),
+        (None, feature_path),
+    ]
+
+
+def test_get_git_dir(temp_git_repo: Path) -> None:
+    """Test resolving git directories for main and linked worktrees."""
+    feature_path = temp_git_repo.parent / "gitdir-feature"
+    subprocess.run(
+        ["git", "worktree", "add", "-b", "gitdir-feature", str(feature_path), "HEAD"],
+        cwd=temp_git_repo,
+        capture_output=True,
+        check=True,
+    )
+
+    assert get_git_dir(temp_git_repo) == temp_git_repo / ".git"
+
+    linked = get_git_dir(feature_path)
+    expected = subprocess.run(
+        ["git", "rev-parse", "--absolute-git-dir"],
+        cwd=feature_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    assert linked.resolve() == Path(expected).resolve()
+
+    result = git_command("status", "--porcelain", repo=feature_path, capture=True, gitdir=linked)
+    assert result.stdout == ""
+
+
+def test_parse_worktrees_porcelain_records(monkeypatch, tmp_path: Path) -> None:
+    """Test parsing porcelain records, including detached and bare entries."""
+    from claude_worktree import git_utils
+
+    porcelain = (
+        "worktree /repo\nHEAD abc\nbranch refs/heads/main\n\n"
+        "worktree /repo-detached\nHEAD def\ndetached\n\n"
+        "worktree /repo-feature\nHEAD 123\nbranch refs/heads/feature\nlocked\n"
+    )
+    monkeypatch.setattr(
+        git_utils,
+        "git_command",
+        lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, stdout=porcelain),
+    )
+
+    assert parse_worktrees(tmp_path) == [
+        ("refs/heads/main", Path("/repo")),
+        ("(detached)", Path("/repo-detached")),
+        ("refs/heads/feature", Path("/repo-feature")),
+    ]
+
+
+def test_parse_worktrees_cache(temp_git_repo: Path, monkeypatch) -> None:
+    """Test that parse_worktrees is memoized until worktree state changes."""
+    from claude_worktree import git_utils
+
+    feature_path = temp_git_repo.parent / "cached-feature"
+    subprocess.run(
+        ["git", "worktree", "add", "-b", "cached-feature", str(feature_path), "HEAD"],
+        cwd=temp_git_repo,
+        capture_output=True,
+        check=True,
+    )
+    first = parse_worktrees(temp_git_repo)
+
+    calls = []
+    real_parse = git_utils._parse_worktrees
+    monkeypatch.setattr(
+        git_utils, "_parse_worktrees", lambda repo: calls.append(repo) or real_parse(repo)
+    )
+    assert parse_worktrees(temp_git_repo) == first
+    assert calls == []
+
+    # Switching branches inside the linked worktree must invalidate the cache
+    subprocess.run(
+        ["git", "checkout", "-b", "switched-branch"],
+        cwd=feature_path,
+        capture_output=True,
+        check=True,
+    )
+    branches = [br for br, _ in parse_worktrees(temp_git_repo)]
+    assert "refs/heads/switched-branch" in branches
+    assert len(calls) == 1
+
+    # An explicit clear forces the next lookup back to git
+    git_utils.clear_worktree_cache()
+    parse_worktrees(temp_git_repo)
+    assert len(calls) == 2
+
+
+def test_first_existing_branch(temp_git_repo: Path) -> None:
+    """Test preference-ordered branch probing with one git call."""
+    subprocess.run(["git", "branch", "develop"], cwd=temp_git_repo, check=True)
+    subprocess.run(["git", "tag", "develop-tag"], cwd=temp_git_repo, check=True)
+
+    assert first_existing_branch(["develop", "main"], temp_git_repo) == "develop"
+    assert first_existing_branch(["missing", "develop"], temp_git_repo) == "develop"
+    assert first_existing_branch(["develop-tag", "missing"], temp_git_repo) is None
+    assert first_existing_branch([], temp_git_repo) is None
+
+
 def test_find_worktree_by_branch(temp_git_repo: Path) -> None:
     """Test finding worktree by branch name."""
     # Create a new worktree
@@ -322,6 +519,63 @@ def test_find_worktree_by_branch(temp_git_repo: Path) -> None:
     assert find_worktree_by_branch(temp_git_repo, "refs/heads/nonexistent") is None
 
 
+def test_find_worktree_by_branch_or_name(temp_git_repo: Path) -> None:
+    """Test the single-pass branch and directory name lookup."""
+    # Worktree directory "shadow" has branch "other" checked out
+    shadow_path = temp_git_repo.parent / "shadow"
+    subprocess.run(
+        ["git", "worktree", "add", "-b", "other", str(shadow_path), "HEAD"],
+        cwd=temp_git_repo,
+        capture_output=True,
+        check=True,
+    )
+
+    assert find_worktree_by_branch_or_name(temp_git_repo, "other") == (shadow_path, None)
+    assert find_worktree_by_branch_or_name(temp_git_repo, "shadow") == (None, shadow_path)
+    assert find_worktree_by_branch_or_name(temp_git_repo, "missing") == (None, None)
+
+
+def test_worktree_index(temp_git_repo: Path) -> None:
+    """Test the memoized branch -> worktree mapping."""
+    feature_path = temp_git_repo.parent / "indexed"
+    subprocess.run(
+        ["git", "worktree", "add", "-b", "indexed", str(feature_path), "HEAD"],
+        cwd=temp_git_repo,
+        capture_output=True,
+        check=True,
+    )
+
+    index = worktree_index(temp_git_repo)
+    assert index["refs/heads/main"] == temp_git_repo
+    assert index["refs/heads/indexed"] == feature_path
+    assert worktree_index(temp_git_repo) is index
+
+    # Removing the worktree invalidates the memoized index
+    subprocess.run(
+        ["git", "worktree", "remove", str(feature_path)],
+        cwd=temp_git_repo,
+        capture_output=True,
+        check=True,
+    )
+    assert "refs/heads/indexed" not in worktree_index(temp_git_repo)
+
+
+def test_worktree_path_index(temp_git_repo: Path) -> None:
+    """Test the memoized resolved path -> branch mapping."""
+    feature_path = temp_git_repo.parent / "path-indexed"
+    subprocess.run(
+        ["git", "worktree", "add", "-b", "path-indexed", str(feature_path), "HEAD"],
+        cwd=temp_git_repo,
+        capture_output=True,
+        check=True,
+    )
+
+    index = worktree_path_index(temp_git_repo)
+    assert index[os.path.realpath(temp_git_repo)] == "main"
+    assert index[os.path.realpath(feature_path)] == "path-indexed"
+    assert worktree_path_index(temp_git_repo) is index
+
+
 def test_has_command() -> None:
     """Test checking if command exists."""
     # Git must exist for tests to run
@@ -331,6 +585,18 @@ def test_has_command() -> None:
     assert not has_command("definitely-not-a-real-command-xyz-12345")
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="Relies on executable bit lookup")
+def test_has_command_follows_path_changes(tmp_path: Path, monkeypatch) -> None:
+    """Test that memoized command lookups are keyed on PATH."""
+    tool = tmp_path / "cw-fake-tool"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+
+    assert not has_command("cw-fake-tool")
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+    assert has_command("cw-fake-tool")
+
+
 def test_config_operations(temp_git_repo: Path) -> None:
     """Test git config get/set/unset operations."""
     # Set a config value
@@ -347,6 +613,30 @@ def test_config_operations(temp_git_repo: Path) -> None:
     value = get_config("test.key", temp_git_repo)
     assert value is None
 
+    # Unsetting a missing key is a no-op
+    unset_config("test.key", temp_git_repo)
+    assert get_config("test.key", temp_git_repo) is None
+
+
+def test_config_cache(temp_git_repo: Path) -> None:
+    """Test that cached config lookups follow git's key rules and external edits."""
+    set_config("branch.Feature/X.worktreeBase", "main", temp_git_repo)
+
+    # Section and variable names are case-insensitive, the subsection is not
+    assert get_config("BRANCH.Feature/X.WORKTREEBASE", temp_git_repo) == "main"
+    assert get_config("branch.feature/x.worktreeBase", temp_git_repo) is None
+
+    # A value written by another process is picked up on the next lookup
+    subprocess.run(
+        ["git", "config", "--local", "branch.Feature/X.worktreeBase", "develop-branch"],
+        cwd=temp_git_repo,
+        check=True,
+    )
+    assert get_config("branch.Feature/X.worktreeBase", temp_git_repo) == "develop-branch"
+
+    unset_config("branch.Feature/X.worktreeBase", temp_git_repo)
+    assert get_config("branch.Feature/X.worktreeBase", temp_git_repo) is None
+
 
 def test_is_valid_branch_name(temp_git_repo: Path) -> None:
     """Test branch name validation."""
@@ -15,6 +15,7 @@ from claude_worktree.operations.helpers import (
     _disambiguate_global_matches,
     _resolve_global_target,
     is_global_mode,
+    parse_repo_branch_target,
     resolve_worktree_target,
     set_global_mode,
 )
@@ -138,6 +139,25 @@ class TestGlobalListWorktrees:
             cwd=repo, check=False, capture_output=True,
         )
 
+    def test_list_multiple_repos_in_name_order(self, tmp_path: Path, capsys) -> None:
+        """global_list_worktrees probes repos concurrently but prints them sorted."""
+        repo_b, wt_b = _make_repo_with_worktree(tmp_path, "bbb-proj", "feat-b")
+        repo_a, wt_a = _make_repo_with_worktree(tmp_path, "aaa-proj", "feat-a")
+        register_repo(repo_b)
+        register_repo(repo_a)
+
+        global_list_worktrees()
+
+        out = capsys.readouterr().out
+        assert out.index("aaa-proj") < out.index("bbb-proj")
+        assert "2 repo(s), 2 worktree(s)" in out
+
+        for repo, wt_path in ((repo_a, wt_a), (repo_b, wt_b)):
+            subprocess.run(
+                ["git", "worktree", "remove", "--force", str(wt_path)],
+                cwd=repo, check=False, capture_output=True,
+            )
+
     def test_list_shows_branch_mismatch(self, tmp_path: Path) -> None:
         """global_list_worktrees shows mismatch indicator when branch differs."""
         repo, wt_path = _make_repo_with_worktree(tmp_path, "mismatch-proj", "intended-branch")
@@ -282,7 +302,7 @@ def _make_repo_with_worktree(
     return repo, wt_path
 
 
-class TestContextVar:
+class TestGlobalModeFlag:
     def test_default_is_false(self) -> None:
         """Global mode defaults to False."""
         set_global_mode(False)
@@ -296,6 +316,22 @@ class TestContextVar:
         assert is_global_mode() is False
 
 
+class TestParseRepoBranchTarget:
+    @pytest.mark.parametrize(
+        ("target", "expected"),
+        [
+            ("proj:feat", ("proj", "feat")),
+            ("proj:feat:x", ("proj", "feat:x")),
+            ("feat", (None, "feat")),
+            (":feat", (None, ":feat")),
+            ("proj:", (None, "proj:")),
+        ],
+    )
+    def test_parse(self, target: str, expected: tuple) -> None:
+        """parse_repo_branch_target splits only well-formed repo:branch."""
+        assert parse_repo_branch_target(target) == expected
+
+
 class TestResolveGlobalTarget:
     def test_finds_branch_in_registered_repo(self, tmp_path: Path) -> None:
         """_resolve_global_target finds a branch across registered repos."""
@@ -349,6 +385,45 @@ class TestResolveGlobalTarget:
             cwd=repo_b, check=False, capture_output=True,
         )
 
+    def test_matches_ordered_by_repo_name(self, tmp_path: Path) -> None:
+        """_resolve_global_target orders matches by repo name, not registration."""
+        repo_z, wt_z = _make_repo_with_worktree(tmp_path, "zulu", "ordered")
+        repo_a, wt_a = _make_repo_with_worktree(tmp_path, "alpha", "ordered")
+        register_repo(repo_z)
+        register_repo(repo_a)
+
+        matches = _resolve_global_target("ordered")
+        assert [m[2] for m in matches] == [repo_a, repo_z]
+
+        for repo, wt in ((repo_a, wt_a), (repo_z, wt_z)):
+            subprocess.run(
+                ["git", "worktree", "remove", "--force", str(wt)],
+                cwd=repo, check=False, capture_output=True,
+            )
+
+    def test_dedupes_worktree_reached_via_symlinked_repo(self, tmp_path: Path) -> None:
+        """_resolve_global_target reports a worktree once across repo aliases."""
+        repo, wt_path = _make_repo_with_worktree(tmp_path, "origin", "dup-branch")
+        alias = tmp_path / "alias"
+        alias.symlink_to(repo)
+        now = "2026-01-01T00:00:00+00:00"
+        save_registry({
+            "version": 1,
+            "repositories": {
+                str(path): {"name": name, "registered_at": now, "last_seen": now}
+                for name, path in (("origin", repo), ("alias", alias))
+            },
+        })
+
+        matches = _resolve_global_target("dup-branch")
+        assert len(matches) == 1
+        assert matches[0][1] == "dup-branch"
+
+        subprocess.run(
+            ["git", "worktree", "remove", "--force", str(wt_path)],
+            cwd=repo, check=False, capture_output=True,
+        )
+
     def test_skips_missing_repos(self, tmp_path: Path) -> None:
         """_resolve_global_target skips repos that no longer exist on disk."""
         save_registry({
@@ -364,6 +439,22 @@ class TestResolveGlobalTarget:
         matches = _resolve_global_target("any-branch")
         assert len(matches) == 0
 
+    def test_repo_dir_exists_caches_hits(self, tmp_path: Path, monkeypatch) -> None:
+        """_repo_dir_exists re-stats only misses and expired hits."""
+        from claude_worktree.operations import helpers
+
+        repo = tmp_path / "cached-repo"
+        repo.mkdir()
+        assert helpers._repo_dir_exists(repo) is True
+
+        calls = []
+        monkeypatch.setattr(helpers.os.path, "isdir", lambda p: calls.append(p) or False)
+        assert helpers._repo_dir_exists(repo) is True
+        assert calls == []
+
+        assert helpers._repo_dir_exists(tmp_path / "missing") is False
+        assert len(calls) == 1
+
 
 class TestDisambiguateGlobalMatches:
     def test_single_match_returns_immediately(self, tmp_path: Path) -> None:
@@ -384,6 +475,27 @@ class TestDisambiguateGlobalMatches:
         with pytest.raises(WorktreeNotFoundError, match="Ambiguous"):
             _disambiguate_global_matches("branch", matches)
 
+    def test_reprompts_until_valid_choice(self, tmp_path: Path, monkeypatch) -> None:
+        """_disambiguate_global_matches re-asks on non-numeric or out-of-range input."""
+        import io
+
+        from rich.console import Console
+
+        from claude_worktree.operations import helpers
+
+        console = Console(file=io.StringIO())
+        answers = iter(["", "x", "-1", "0", "3", " 2 "])
+        monkeypatch.setattr(console, "input", lambda prompt: next(answers))
+        monkeypatch.setattr(helpers, "get_console", lambda: console)
+        monkeypatch.setattr(helpers, "is_non_interactive", lambda: False)
+        matches = [
+            (tmp_path / "wt1", "branch", tmp_path / "repo1"),
+            (tmp_path / "wt2", "branch", tmp_path / "repo2"),
+        ]
+
+        assert _disambiguate_global_matches("branch", matches) == matches[1]
+        assert console.file.getvalue().count("Please enter a number between 1 and 2") == 5
+
 
 class TestResolveWorktreeTargetGlobal:
     def test_global_mode_none_target_raises(self) -> None:
@@ -225,8 +225,9 @@ class TestLauncherFunctions:
 
         mock_run.assert_called_once()
         call_args = mock_run.call_args
-        # Check that the script contains "horizontally"
-        assert "horizontally" in call_args[0][0][2]
+        # AppleScript is piped straight to osascript
+        assert call_args[0][0] == ["osascript", "-"]
+        assert "horizontally" in call_args[1]["input"]
 
     @patch("subprocess.run")
     @patch("sys.platform", "darwin")
@@ -241,7 +242,18 @@ class TestLauncherFunctions:
 
         mock_run.assert_called_once()
         call_args = mock_run.call_args
-        assert "vertically" in call_args[0][0][2]
+        assert "vertically" in call_args[1]["input"]
+
+    @patch("subprocess.run")
+    @patch("sys.platform", "darwin")
+    def test_iterm_escapes_applescript_string(self, mock_run):
+        """Test that quotes in the shell line are escaped for AppleScript."""
+        from claude_worktree.operations.ai_tools import _launch_iterm_window
+
+        _launch_iterm_window(Path("/test/work tree"), 'claude "hi"', "claude")
+
+        script = mock_run.call_args[1]["input"]
+        assert "write text \"cd '/test/work tree' && claude \\\"hi\\\"\"" in script
 
     @patch("sys.platform", "linux")
     def test_iterm_pane_non_macos(self):
@@ -597,6 +609,20 @@ class TestLaunchAIToolIntegration:
             launch_ai_tool(Path("/test"), bg=True)
 
         mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["claude"]
+
+    @patch("subprocess.Popen")
+    @patch("sys.platform", "linux")
+    def test_run_detached_execs_without_shell(self, mock_popen):
+        """Test detached launch executes the tokenized command directly."""
+        from claude_worktree.operations.ai_tools import _run_detached
+
+        _run_detached(["claude", "--continue"], Path("/test/worktree"))
+
+        mock_popen.assert_called_once()
+        assert mock_popen.call_args[0][0] == ["claude", "--continue"]
+        assert mock_popen.call_args[1]["start_new_session"] is True
+        assert mock_popen.call_args[1]["cwd"] == str(Path("/test/worktree"))
 
     @patch("claude_worktree.operations.ai_tools._launch_iterm_window")
     @patch("claude_worktree.operations.ai_tools.has_command", return_value=True)
@@ -1,8 +1,11 @@
 """Tests for the global repository registry."""
 
 import json
+import os
 from pathlib import Path
 
+import pytest
+
 from claude_worktree.registry import (
     get_all_registered_repos,
     get_registry_path,
@@ -62,6 +65,41 @@ class TestLoadRegistry:
         assert registry["version"] == 1
         assert registry["repositories"] == {}
 
+    def test_load_caches_until_file_changes(self, monkeypatch) -> None:
+        """load_registry reuses the parsed file until it is rewritten."""
+        import claude_worktree.registry as registry
+
+        save_registry({"version": 1, "repositories": {"/a": {"name": "a"}}})
+        calls = []
+        real_loads = registry._loads
+        monkeypatch.setattr(registry, "_loads", lambda b: calls.append(b) or real_loads(b))
+
+        first = load_registry()
+        first["repositories"]["/a"]["name"] = "mutated"
+        assert load_registry()["repositories"]["/a"]["name"] == "a"
+        assert calls == []
+
+        # Rewritten by another process: picked up via the (inode, mtime_ns, size) stamp
+        get_registry_path().write_text(json.dumps({"version": 1, "repositories": {}}))
+        assert load_registry()["repositories"] == {}
+        assert len(calls) == 1
+
+    def test_load_detects_same_size_replace_within_mtime_tick(self) -> None:
+        """A replaced file with the old size and mtime is still reloaded."""
+        save_registry({"version": 1, "repositories": {"/a": {"name": "a"}}})
+        registry_path = get_registry_path()
+        assert load_registry()["repositories"] == {"/a": {"name": "a"}}
+        old = os.stat(registry_path)
+
+        # Another process's save: same-size content swapped in, mtime unchanged
+        replacement = registry_path.with_name("other.tmp")
+        replacement.write_bytes(registry_path.read_bytes().replace(b'a"', b'b"'))
+        os.replace(replacement, registry_path)
+        os.utime(registry_path, ns=(old.st_atime_ns, old.st_mtime_ns))
+        assert os.stat(registry_path).st_size == old.st_size
+
+        assert load_registry()["repositories"] == {"/b": {"name": "b"}}
+
 
 class TestSaveRegistry:
     def test_save_creates_file(self) -> None:
@@ -75,6 +113,44 @@ class TestSaveRegistry:
         loaded = json.loads(registry_path.read_text())
         assert loaded == data
 
+    def test_save_writes_raw_utf8(self) -> None:
+        """Non-ASCII names are written unescaped, with or without orjson."""
+        save_registry({"version": 1, "repositories": {"/café": {"name": "café"}}})
+
+        raw = get_registry_path().read_bytes()
+        assert "café".encode() in raw
+        assert b"\\u00e9" not in raw
+
+    def test_save_replaces_file_atomically(self, monkeypatch) -> None:
+        """A failed save leaves the previous registry intact."""
+        import claude_worktree.registry as registry
+
+        save_registry({"version": 1, "repositories": {"keep": {"name": "keep"}}})
+
+        def fail(obj):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(registry, "_dumps", fail)
+        with pytest.raises(OSError, match="disk full"):
+            save_registry({"version": 1, "repositories": {}})
+
+        registry_path = get_registry_path()
+        loaded = json.loads(registry_path.read_text())
+        assert loaded["repositories"] == {"keep": {"name": "keep"}}
+        assert list(registry_path.parent.glob("*.tmp")) == []
+
+    def test_concurrent_saves_use_separate_temp_files(self) -> None:
+        """Overlapping saves each publish a complete registry."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        payloads = [{"version": 1, "repositories": {f"r{i}": {"name": f"r{i}"}}} for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(save_registry, payloads))
+
+        registry_path = get_registry_path()
+        assert json.loads(registry_path.read_text()) in payloads
+        assert list(registry_path.parent.glob("*.tmp")) == []
+
 
 class TestRegisterRepo:
     def test_register_new_repo(self, tmp_path: Path) -> None:
@@ -114,6 +190,18 @@ class TestRegisterRepo:
             == registry1["repositories"][key]["registered_at"]
         )
 
+    def test_register_symlinked_repo_uses_target(self, tmp_path: Path) -> None:
+        """A symlinked repo root is registered under its real path."""
+        repo_path = tmp_path / "real-project"
+        repo_path.mkdir()
+        link = tmp_path / "link-project"
+        link.symlink_to(repo_path)
+
+        register_repo(link)
+
+        registry = load_registry()
+        assert list(registry["repositories"]) == [str(repo_path.resolve())]
+
 
 class TestUpdateLastSeen:
     def test_update_registered_repo(self, tmp_path: Path) -> None:
@@ -132,6 +220,28 @@ class TestUpdateLastSeen:
 
         assert second_seen >= first_seen
 
+    def test_update_skips_recent_timestamp(self, tmp_path: Path, monkeypatch) -> None:
+        """update_last_seen only rewrites the registry once the timestamp is stale."""
+        import claude_worktree.registry as registry
+
+        repo_path = tmp_path / "recent-project"
+        repo_path.mkdir()
+        register_repo(repo_path)
+        key = str(repo_path.resolve())
+
+        data = load_registry()
+        data["repositories"][key]["last_seen"] = "2020-01-01T00:00:00+00:00"
+        stale = json.dumps(data)
+
+        saves = []
+        monkeypatch.setattr(registry, "save_registry", saves.append)
+        update_last_seen(repo_path)
+        assert saves == []
+
+        get_registry_path().write_text(stale)
+        update_last_seen(repo_path)
+        assert saves[0]["repositories"][key]["last_seen"] > "2020"
+
     def test_update_unregistered_repo_is_noop(self, tmp_path: Path) -> None:
         """update_last_seen is a no-op for unregistered repos."""
         repo_path = tmp_path / "unknown-project"
@@ -332,3 +442,14 @@ class TestScanForRepos:
         # This should not scan that deep with depth=2
         found = scan_for_repos(base_dir=tmp_path, max_depth=2)
         assert found == []
+
+    def test_scan_order_and_depth(self, tmp_path: Path, monkeypatch) -> None:
+        """scan_for_repos walks depth-first in name order and honours max_depth."""
+        import claude_worktree.registry as registry
+
+        monkeypatch.setattr(registry, "_has_worktrees", lambda repo: True)
+        for rel in ("b/nested", "a", "c/d/too-deep", "c/repo"):
+            (tmp_path / rel / ".git").mkdir(parents=True)
+
+        found = scan_for_repos(base_dir=tmp_path, max_depth=1)
+        assert found == [tmp_path / "a", tmp_path / "b" / "nested", tmp_path / "c" / "repo"]
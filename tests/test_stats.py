@@ -131,6 +131,22 @@ def test_show_stats_commit_statistics(temp_git_repo: Path, monkeypatch, capsys)
     assert "Average commits" in captured.out
 
 
+def test_branch_tips_with_same_named_tag(temp_git_repo: Path) -> None:
+    """Test that a tag sharing a branch's name doesn't hide the branch tip."""
+    from claude_worktree.operations.display import _get_branch_tips
+
+    subprocess.run(["git", "branch", "feat"], cwd=temp_git_repo, capture_output=True, check=True)
+    subprocess.run(["git", "tag", "feat"], cwd=temp_git_repo, capture_output=True, check=True)
+    head = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=temp_git_repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    tips = _get_branch_tips(temp_git_repo)
+
+    assert tips["feat"] == head
+    assert "heads/feat" not in tips
+
+
 def test_show_stats_status_distribution(temp_git_repo: Path, monkeypatch, capsys) -> None:
     """Test that status distribution is shown."""
     monkeypatch.chdir(temp_git_repo)
@@ -252,3 +268,11 @@ def test_format_age_years() -> None:
     """Test format_age for years."""
     assert format_age(365.0) == "1y ago"
     assert format_age(730.0) == "2y ago"
+
+
+def test_display_format_age_matches_day_buckets() -> None:
+    """Test that the hour-bucketed display formatter agrees with format_age."""
+    from claude_worktree.operations.display import format_age as display_format_age
+
+    for age_days in (0.0, 0.04, 0.5, 0.99, 1.0, 6.9, 7.0, 29.9, 30.0, 364.9, 365.0, 1000.0):
+        assert display_format_age(age_days) == format_age(age_days)